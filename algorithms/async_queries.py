@@ -0,0 +1,140 @@
+'''
+Description: asyncio variants of the traversals and shortest path searches for graphs queried from an event loop.
+             The searches are the generators of algorithms/shortest_path_tree.py and algorithms/traversal.py, paused
+             every yield_every units of work (neighbors examined, plus every entry of a row scanned by the matrix
+             representations), and a driver either resumes them from the event loop, handing control back to other
+             tasks at every pause, or runs them in a thread of an executor. Both drivers stop the search at the next
+             pause when the task is cancelled or its timeout expires, so an aborted query does not keep running in
+             the background.
+             A query on a snapshot never blocks writers while it is paused and sees the graph as it was when it
+             started. The snapshot is taken in a thread while the timeout runs, so a query waiting for a writer to
+             release the graph is aborted like a running one. By default a query takes a snapshot only when the
+             representation says snapshots are cheap (prop.cheap_snapshots()). The first write after a snapshot then
+             copies the outer vertex lists of AdjacentSet and AdjacentMatrix, O(V), and a CSR snapshot merges the
+             staged edges. NumpyMatrix would copy its whole matrix, O(V^2) for the dense one, so its queries read
+             the live graph and may see writes made while they are paused unless snapshot=True.
+
+Usage: await bfs_async(graph, 0) #Same result as graph.breadth_first_search(0).
+       await dfs_async(graph, 0) #Same result as graph.depth_first_search(0).
+       await shortest_path_unweighted_async(graph, 0, 4) #Raises ValueError when there is no path, like the sync method.
+       await shortest_path_weighted_async(graph, 0, 4) #Dijkstra, [] when there is no path.
+       await minimum_cost_async(graph, 0, 4) #0 when there is no path.
+       await shortest_path_tree_async(graph, 0, weighted=True) #ShortestPathTree of algorithms/shortest_path_tree.py.
+
+       Every function takes the keyword options
+       yield_every=1024  units of work between two pauses, smaller values give other tasks lower latency
+       timeout=None      seconds before the query is aborted with asyncio.TimeoutError
+       executor=None     a concurrent.futures.ThreadPoolExecutor runs the query in one of its threads instead of on the
+                         event loop, process pools are not supported
+       snapshot=None     True runs on a snapshot, False on the live graph, None (the default) takes a snapshot
+                         only when prop.cheap_snapshots(), see above for what a snapshot costs the next write
+
+'''
+import asyncio
+import threading
+from algorithms.shortest_path_tree import bfs_steps, dijkstra_steps
+from algorithms.traversal import iter_bfs, iter_dfs
+
+
+async def bfs_async(graph, source=0, **options):
+    return await _run(graph, lambda prop, every: _visit_steps(prop, iter_bfs(prop, source), every), **options)
+
+
+async def dfs_async(graph, source=0, **options):
+    return await _run(graph, lambda prop, every: _visit_steps(prop, iter_dfs(prop, source), every), **options)
+
+
+async def shortest_path_tree_async(graph, source, weighted=True, **options):
+    steps = dijkstra_steps if weighted else bfs_steps
+    return await _run(graph, lambda prop, every: steps(prop, source, yield_every=every), **options)
+
+
+async def shortest_path_unweighted_async(graph, source, destination, **options):
+    tree = await _run(graph, lambda prop, every: bfs_steps(prop, source, destination, every), **options)
+    path = tree.path_to(destination)
+    if len(path) == 0:
+        raise ValueError(
+            f"No path between source: {source} and destination: {destination}")
+    return path
+
+
+async def shortest_path_weighted_async(graph, source, destination, **options):
+    tree = await _run(graph, lambda prop, every: dijkstra_steps(prop, source, destination, yield_every=every),
+                      **options)
+    return tree.path_to(destination)
+
+
+async def minimum_cost_async(graph, source, destination, **options):
+    tree = await _run(graph, lambda prop, every: dijkstra_steps(prop, source, destination, yield_every=every),
+                      **options)
+    cost = tree.cost_to(destination)
+    if cost is None:
+        return 0
+    return cost
+
+
+async def _run(graph, make_steps, yield_every=1024, timeout=None, executor=None, snapshot=None):
+    if yield_every < 1:
+        raise ValueError(f"yield_every must be at least 1, got {yield_every}")
+    query = _query(graph, make_steps, yield_every, executor, snapshot)
+    if timeout is None:
+        return await query
+    return await asyncio.wait_for(query, timeout)
+
+
+async def _query(graph, make_steps, yield_every, executor, snapshot):
+    if snapshot is None:
+        snapshot = graph.prop.cheap_snapshots()
+    if snapshot:
+        # snapshot waits for a running writer, a thread does the waiting so the event loop and the timeout go on
+        graph = await asyncio.get_running_loop().run_in_executor(executor, graph.snapshot)
+    steps = make_steps(graph.prop, yield_every)
+    if executor is None:
+        return await _cooperative(steps)
+    return await _in_executor(steps, executor)
+
+
+async def _cooperative(steps):
+    try:
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+            await asyncio.sleep(0)
+    finally:
+        steps.close()
+
+
+async def _in_executor(steps, executor):
+    stopped = threading.Event()
+
+    def run():
+        try:
+            while not stopped.is_set():
+                try:
+                    next(steps)
+                except StopIteration as stop:
+                    return stop.value
+        finally:
+            steps.close()
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, run)
+    finally:
+        # after a cancellation or timeout the thread stops at its next pause
+        stopped.set()
+
+
+def _visit_steps(prop, vertices, yield_every):
+    # the neighbors of every visited vertex are looked up once, the lookup is counted when the vertex is visited
+    get_outdegree, scan_cost = prop.get_outdegree, prop.neighbor_scan_cost()
+    order = []
+    work = 0
+    for vertex in vertices:
+        order.append(vertex)
+        work += scan_cost+get_outdegree(vertex)
+        if work >= yield_every:
+            work = 0
+            yield
+    return order
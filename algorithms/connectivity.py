@@ -0,0 +1,225 @@
+'''
+Description: Connected components, strongly connected components and an index answering connectivity queries
+             without searching. Every traversal is iterative, so deep graphs never hit the recursion limit.
+
+Usage: component, count = connected_components(graph.prop) #component[v] is the id of the component of v, 0..count-1.
+                                                            #Directed graphs get their weakly connected components.
+       component, count = strongly_connected_components(graph.prop) #Tarjan, ids in reverse topological order.
+       component, count = strongly_connected_components(graph.prop, "kosaraju") #Kosaraju, ids in topological order.
+       index = ConnectivityIndex(graph.prop)
+       index.are_connected(0, 4) #True when 0 and 4 are in the same (strongly, for directed graphs) connected component.
+       index.component_of(4), index.num_components() #Component id of 4 and the number of components.
+       index.close() #Stops following the mutations of graph.prop.
+
+       ConnectivityIndex subscribes to the representation. On undirected graphs added edges and vertices are merged
+       into a union find in near constant time. Removals, and on directed graphs any edge joining two different strongly
+       connected components, mark the index stale and the next query rebuilds it in O(V+E).
+
+'''
+import threading
+from array import array
+from collections import deque
+from help_ds.disjoint_set import DisjointSet
+
+
+def connected_components(prop):
+    n = prop.num_vertices
+    component = [-1]*n
+    count = 0
+    for root in range(n):
+        if component[root] != -1:
+            continue
+        component[root] = count
+        queue = deque([root])
+        while queue:
+            vertex = queue.popleft()
+            neighbors = prop.get_adjacent_vertices(vertex)
+            if prop.directed:
+                neighbors = list(neighbors)+list(prop.get_incoming_vertices(vertex))
+            for v in neighbors:
+                if component[v] == -1:
+                    component[v] = count
+                    queue.append(v)
+        count += 1
+    return component, count
+
+
+def strongly_connected_components(prop, strategy="tarjan"):
+    if strategy == "tarjan":
+        return _tarjan(prop)
+    if strategy == "kosaraju":
+        return _kosaraju(prop)
+    raise ValueError(f"Unknown strategy {strategy}")
+
+
+def _tarjan(prop):
+    n = prop.num_vertices
+    get_adjacent_vertices = prop.get_adjacent_vertices
+    index = array('l', [-1])*n
+    low = array('l', [0])*n
+    on_stack = bytearray(n)
+    component = [-1]*n
+    stack = []
+    count = counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # one neighbor iterator per vertex on the dfs path, mirroring the frames of the recursive algorithm
+        path = [(root, iter(get_adjacent_vertices(root)))]
+        while path:
+            v, neighbors = path[-1]
+            for w in neighbors:
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    path.append((w, iter(get_adjacent_vertices(w))))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                path.pop()
+                if path and low[v] < low[path[-1][0]]:
+                    low[path[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+    return component, count
+
+
+def _kosaraju(prop):
+    n = prop.num_vertices
+    get_adjacent_vertices = prop.get_adjacent_vertices
+    visited = bytearray(n)
+    finished = []
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        path = [(root, iter(get_adjacent_vertices(root)))]
+        while path:
+            v, neighbors = path[-1]
+            for w in neighbors:
+                if not visited[w]:
+                    visited[w] = 1
+                    path.append((w, iter(get_adjacent_vertices(w))))
+                    break
+            else:
+                path.pop()
+                finished.append(v)
+    # the second pass walks the reversed edges from the vertices finished last
+    component = [-1]*n
+    count = 0
+    for root in reversed(finished):
+        if component[root] != -1:
+            continue
+        component[root] = count
+        stack = [root]
+        while stack:
+            for w in prop.get_incoming_vertices(stack.pop()):
+                if component[w] == -1:
+                    component[w] = count
+                    stack.append(w)
+        count += 1
+    return component, count
+
+
+class ConnectivityIndex(object):
+    def __init__(self, prop):
+        self._prop = prop
+        self._lock = threading.Lock()
+        self._stale = True
+        self._components = None
+        self._component = None
+        self._count = 0
+        prop.subscribe(self._on_change)
+
+    def close(self):
+        self._prop.unsubscribe(self._on_change)
+
+    def are_connected(self, u, v):
+        self._check_vertex(u)
+        self._check_vertex(v)
+        if self._stale:
+            self._rebuild()
+        if self._components is not None:
+            return self._components.connected(u, v)
+        return self._component[u] == self._component[v]
+
+    def component_of(self, v):
+        '''Returns the id of the component of v, ids are only stable until the graph is mutated'''
+        self._check_vertex(v)
+        if self._stale:
+            self._rebuild()
+        if self._components is not None:
+            return self._components.find(v)
+        return self._component[v]
+
+    def num_components(self):
+        if self._stale:
+            self._rebuild()
+        if self._components is not None:
+            return self._components.num_sets
+        return self._count
+
+    def _check_vertex(self, v):
+        if v >= self._prop.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+
+    def _rebuild(self):
+        with self._lock:
+            if not self._stale:
+                return
+            prop = self._prop
+            if prop.directed:
+                self._component, self._count = strongly_connected_components(prop)
+                self._components = None
+            else:
+                components = DisjointSet(prop.num_vertices)
+                for v1 in range(prop.num_vertices):
+                    for v2 in prop.get_adjacent_vertices(v1):
+                        components.union(v1, v2)
+                self._components = components
+            self._stale = False
+
+    def _on_change(self, event, *args):
+        if self._stale:
+            return
+        if event == "add_vertex":
+            if self._components is not None:
+                self._components.add()
+            else:
+                self._component.append(self._count)
+                self._count += 1
+        elif event == "add_vertices":
+            first, count = args
+            if self._components is not None:
+                for _ in range(count):
+                    self._components.add()
+            else:
+                self._component.extend(range(self._count, self._count+count))
+                self._count += count
+        elif event in ("add_edge", "add_edges"):
+            src, dst, weights = ([args[0]], [args[1]], [args[2]]) if event == "add_edge" else args
+            if any(weight <= 0 for weight in weights):
+                # matrix representations treat a weight of 0 or less as no edge
+                self._stale = True
+                return
+            if self._components is not None:
+                for v1, v2 in zip(src, dst):
+                    self._components.union(v1, v2)
+            elif any(self._component[v1] != self._component[v2] for v1, v2 in zip(src, dst)):
+                # an edge between two strongly connected components may merge every component on a cycle with it
+                self._stale = True
+        else:
+            self._stale = True
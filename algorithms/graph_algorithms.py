@@ -14,162 +14,444 @@ Usage: create an object of the AdjacentMatrix class and call it's methods on the
 
        INITIALIZATION:
        graph=Graph(num_vertices) #Takes an optional argument rep which specifies the type of representation to use.
+       graph=Graph(num_vertices,rep="CSR") #rep is one of "AdjacentMatrix", "AdjacentSet", "CompactSet" (AdjacentSet with compact=True),
+                                            #"CSR" (compact arrays for large sparse graphs),
+                                            #"NumpyMatrix" (numpy dense matrix) or "SparseMatrix" (scipy.sparse matrix).
+       graph=Graph(num_vertices,rep="AdjacentSet",directed=True,reverse_index=False) #Directed AdjacentSet and CompactSet graphs keep
+                                            #the incoming vertices of every vertex unless reverse_index is False, which saves
+                                            #memory but makes get_incoming_vertices, and the algorithms using it, scan every vertex.
+       Vertices are the integers 0..num_vertices-1, see LabeledGraph in algorithms/labeled_graph.py for string or UUID vertices.
        
+       BULK CONSTRUCTION:
+       graph=Graph.from_edges(num_vertices,[0,0,1],[1,2,3],[2,1,5]) #Builds the graph from parallel src, dst and weights sequences.
+       graph=Graph.from_edge_list_file("edges.txt") #Reads "v1 v2 [weight]" lines, num_vertices defaults to the largest vertex+1.
+       graph=Graph.from_edge_chunks(num_vertices,iter_edge_list("edges.txt")) #Adds (src, dst, weights) chunks one at a time,
+                                                                              #see storage/streaming.py for the readers.
+       graph=Graph.from_numpy(edges) #edges is an (E,2) or (E,3) array of src, dst and optionally weight columns.
+
+       BINARY FILES:
+       graph.save("graph.bin") #Writes the versioned binary CSR file format described in storage/binary_format.py.
+       build_csr_file(iter_edge_list("edges.txt"),"graph.bin") #Builds the file out of core for graphs larger than memory.
+       graph=Graph.load("graph.bin") #Memory maps the file read only, processes loading the same file share its pages.
+       graph.close() #Unmaps a loaded file, does nothing for other graphs. "with Graph.load(path) as graph:" closes on exit.
+                     #Neighbor views returned before closing keep the pages mapped until they are released.
+
        CALLING GRAPH ALGORITHMS:
        graph.breadth_first_search(0) #Returns a list of visited vertices using bfs traversal.
        graph.depth_first_search(0) #Returns a list of visited vertices using dfs traversal
+       graph.iter_bfs(0) #Generator yielding vertices in bfs order, stop iterating to end the traversal early.
+       graph.iter_dfs(0) #Generator yielding vertices in dfs preorder, iterative so deep graphs do not hit the recursion limit.
        graph.topological_sort() #Returns a list of visited vertices satisfying all precedence relationships.
        graph.shortest_path_unweighted(0,1) #Returns the shortest path between source and destination for an unweighted graph.
        graph.shortest_path_weighted(0,1) #Returns the shortest path using djisktra's algorithm between source and destination for a weighted graph.
        graph.minimum_cost(0,1) #Returns an int that is the minimum cost b/w source and destination
-       graph.minimum_spanning_tree_prim() #Returns a spanning tree list from source for non-isolated graphs
-       graph.minimum_spanning_tree_kruskal() #Returns a spanning tree list from source for disconnected graphs
+       graph.shortest_path_unweighted(0,1,strategy="bidirectional") #Bfs from both ends, strategy defaults to "bfs".
+       graph.shortest_path_weighted(0,1,strategy="bidirectional") #Dijkstra from both ends, strategy defaults to "dijkstra".
+       graph.shortest_path_weighted(0,1,strategy="astar",heuristic=euclidean_heuristic(coordinates)) #A* with an admissible heuristic(v, destination).
+       graph.minimum_cost(0,1,strategy="astar",heuristic=heuristic) #minimum_cost accepts the same strategies.
+       tree=graph.shortest_path_tree(0) #Runs dijkstra once (bfs with weighted=False) from 0 for many destination queries.
+       tree.path_to(4), tree.cost_to(4) #Shortest path and its cost from 0 to 4, answered from the tree.
+       graph.minimum_spanning_tree_prim(0) #Returns the (v1, v2, weight) edges of the minimum spanning tree of the component of 0.
+       graph.minimum_spanning_tree_kruskal() #Returns the (v1, v2, weight) edges of a minimum spanning forest, pass a source for a single tree.
+       component, count = graph.connected_components() #component[v] is the component id of v, weakly connected for directed graphs.
+       component, count = graph.strongly_connected_components() #Tarjan, strategy="kosaraju" also works.
+       graph.are_connected(0,4) #O(1) lookup in a ConnectivityIndex built on the first call and kept up to date as the graph changes,
+                                #on directed graphs it tells whether 0 and 4 are strongly connected.
        
+       CACHING SHORTEST PATHS:
+       graph.enable_cache(maxsize=1024,max_bytes=None) #Opt in LRU cache of shortest_path_weighted, shortest_path_unweighted and minimum_cost results.
+       graph.cache_stats() #Returns the hits, misses, evictions, invalidations, entries and estimated bytes of the cache.
+       graph.disable_cache() #Drops the cache.
+       Every mutation bumps graph.prop.version and the cache empties itself the next time it sees a new version.
+
+       INSTRUMENTATION:
+       stats=graph.enable_stats(callback=None) #Opt in counters and wall times of every algorithm call, see algorithms/instrumentation.py.
+       graph.stats() #Returns the counters (vertices settled, edges relaxed, heap pushes/pops/rebuilds, neighbor lookups...)
+                     #and the count, total and max seconds of every method called.
+       graph.disable_stats() #Stops collecting, a disabled graph pays one attribute check per call.
+
+       PARALLEL QUERIES:
+       graph.batch_shortest_paths([0,5,9],workers=4) #Yields (source, distances) pairs computed by a process pool, weighted=False uses bfs.
+       graph.all_pairs_distances(workers=4) #Returns the distance list of every vertex, computed by a process pool.
+       Workers memory map one copy of the graph in the binary file format, see algorithms/parallel.py.
+
+       ASYNC QUERIES:
+       await graph.shortest_path_weighted_async(0,4) #Dijkstra that hands control back to the event loop every 1024 relaxations.
+       await graph.breadth_first_search_async(0,yield_every=256,timeout=2.0) #Raises asyncio.TimeoutError and stops the search after 2s.
+       await graph.minimum_cost_async(0,4,executor=pool) #Runs in a thread of pool, a ThreadPoolExecutor, cancelling the task stops it.
+       depth_first_search_async, shortest_path_unweighted_async and shortest_path_tree_async take the same options. The
+       queries run on a snapshot unless snapshot=False, except on NumpyMatrix graphs where a snapshot would make the next
+       write copy the whole matrix, pass snapshot=True there to pay for it, see algorithms/async_queries.py.
+
+       THREAD SAFETY:
+       Every algorithm keeps its traversal state in local variables, so any number of threads can query one shared graph.
+       The algorithms hold graph.lock for reading while they run, graph.add_edge, graph.add_edges and the dynamic methods take it for writing,
+       so mutating through them waits for running queries and holds new ones back until the edges are in.
+       graph.iter_bfs and graph.iter_dfs are generators and do not hold the lock, wrap them in
+       "with graph.lock.reading():" when writers may run concurrently. Calling graph.prop.add_edge directly bypasses the lock.
+       graph.add_edge(0,1,2) #Adds an edge while holding the write lock.
+       graph.add_edges([0,1],[2,3],[4,1]) #Adds a batch of edges while holding the write lock.
+
+       DYNAMIC GRAPHS:
+       graph.remove_edge(0,1) #Removes the edge between 0 and 1, raises ValueError when there is none.
+       graph.update_weight(0,1,3) #Changes the weight of the existing edge between 0 and 1 to 3.
+       v=graph.add_vertex() #Adds a vertex without edges and returns its number, always num_vertices-1.
+       graph.add_vertices(100) #Adds 100 vertices without edges at once and returns the range of their numbers.
+       graph.remove_vertex(4) #Removes vertex 4 and its edges, vertices above 4 are renumbered one lower.
+       All of them take graph.lock for writing. Every mutation bumps graph.prop.version and calls the listeners added with
+       graph.prop.subscribe(listener) as listener(event, *args), so indexes built on the graph can update incrementally:
+       ("add_edge", v1, v2, weight), ("add_edges", src, dst, weights), ("remove_edge", v1, v2), ("add_vertex", v),
+       ("add_vertices", first, count), ("remove_vertex", v). update_weight is reported as "add_edge".
+
+       SNAPSHOTS:
+       view=graph.snapshot() #Read only Graph frozen at this point, query workers can keep using it while graph is written to.
+       The snapshot shares storage with graph, graph copies a row/vertex (whole matrix for NumpyMatrix) the first time it writes to it.
+
        CALLING GRAPH PROPERTIES:
        graph.prop.add_edge(0,1,2) #This adds an edge of weight 2 between vertices 0 and 1.
        graph.prop.get_adjacent_vertices(0) #This returns a list of adjacent vertices to vertex 0.
        graph.prop.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+       graph.prop.get_incoming_vertices(0) #This returns the vertices with an edge to vertex 0.
        graph.prop.get_indegree(0) #This returns the indegree of vertex 0.
        graph.prop.get_outdegree(0) #This returns the outdegree of vertex 0. 
        graph.prop.display() #This returns the set of edges of the graph with its weights.
 
 '''
 
-from help_ds.priority_dict import priority_dict
 from graph_interface.graph_algorithms import GraphAlgorithms
-from queue import Queue
+from algorithms.traversal import iter_bfs, iter_dfs
+from algorithms.shortest_path_tree import bfs, dijkstra
+from algorithms.spanning_tree import kruskal, prim
+from algorithms.parallel import batch_shortest_paths, all_pairs_distances
+from algorithms.point_to_point import astar, bidirectional_bfs, bidirectional_dijkstra
+from storage.edge_list import read_edge_list
+from storage.streaming import ingest
+from storage.binary_format import load_graph, save_graph
+from help_ds.rw_lock import ReadWriteLock, read_locked
+from help_ds.lru_cache import LRUCache
+from help_ds.indexed_priority_dict import indexed_priority_dict
+from algorithms.async_queries import (bfs_async, dfs_async, minimum_cost_async, shortest_path_tree_async,
+                                     shortest_path_unweighted_async, shortest_path_weighted_async)
+from algorithms.connectivity import ConnectivityIndex, connected_components, strongly_connected_components
+from algorithms.instrumentation import Counters, CountingGraph, GraphStats, counting_queue
+from collections import deque
+import copy
+import threading
+from functools import wraps
+from time import perf_counter
+
+
+def _cached(method):
+    '''Serves repeated calls from graph._cache while the representation keeps the same version'''
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+        cache.sync(self.prop.version)
+        key = (name, args, tuple(sorted(kwargs.items())))
+        result = cache.get(key)
+        if result is None:
+            result = method(self, *args, **kwargs)
+            cache.put(key, result)
+        return list(result) if isinstance(result, list) else result
+    return wrapper
+
+
+def _instrumented(method):
+    '''Times the call and counts its lookups and queue operations into graph._stats, one check when disabled'''
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self._stats
+        if stats is None:
+            return method(self, *args, **kwargs)
+        counters = Counters()
+        # the call runs on a copy of the graph so that other threads keep the uncounted representation
+        view = copy.copy(self)
+        view.prop = CountingGraph(self.prop, counters)
+        view._queue_type = counting_queue(self._queue_type, counters)
+        view._stats = None
+        start = perf_counter()
+        try:
+            return method(view, *args, **kwargs)
+        finally:
+            stats.record(name, perf_counter()-start, counters)
+    return wrapper
 
 
 class Graph(GraphAlgorithms):
-    def __init__(self, num_vertices, rep="AdjacentMatrix", matrix=[], directed=False):
-        super(Graph, self).__init__(num_vertices, rep, matrix, directed)
+    def __init__(self, num_vertices, rep="AdjacentMatrix", matrix=None, directed=False, reverse_index=True):
+        super(Graph, self).__init__(num_vertices, rep, matrix, directed, reverse_index)
+        self.lock = ReadWriteLock()
+        self._cache = None
+        self._stats = None
+        self._queue_type = indexed_priority_dict
+        self._connectivity = None
+        self._connectivity_lock = threading.Lock()
+
+    @classmethod
+    def from_edges(cls, num_vertices, src, dst, weights=None, rep="AdjacentMatrix", directed=False):
+        graph = cls(num_vertices, rep, None, directed)
+        graph.prop.add_edges(src, dst, weights)
+        return graph
+
+    @classmethod
+    def from_edge_chunks(cls, num_vertices, chunks, rep="AdjacentMatrix", directed=False):
+        graph = cls(num_vertices, rep, None, directed)
+        ingest(graph.prop, chunks)
+        return graph
+
+    @classmethod
+    def from_edge_list_file(cls, path, num_vertices=None, rep="AdjacentMatrix", directed=False, delimiter=None):
+        src, dst, weights = read_edge_list(path, delimiter)
+        if num_vertices is None:
+            num_vertices = max(max(src, default=-1), max(dst, default=-1))+1
+        return cls.from_edges(num_vertices, src, dst, weights, rep, directed)
+
+    @classmethod
+    def from_numpy(cls, edges, num_vertices=None, weights=None, rep="AdjacentMatrix", directed=False):
+        if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+            raise ValueError(
+                f"Expected an array of shape (E, 2) or (E, 3), got {edges.shape}")
+        src, dst = edges[:, 0].astype("int64"), edges[:, 1].astype("int64")
+        if edges.shape[1] == 3:
+            weights = edges[:, 2]
+        if num_vertices is None:
+            num_vertices = int(max(src.max(), dst.max()))+1 if len(src) > 0 else 0
+        return cls.from_edges(num_vertices, src, dst, weights, rep, directed)
+
+    @classmethod
+    def load(cls, path):
+        prop = load_graph(path)
+        graph = cls(0, "CSR", None, prop.directed)
+        graph.prop = prop
+        return graph
+
+    @read_locked
+    def save(self, path):
+        save_graph(self.prop, path)
+
+    def close(self):
+        with self.lock.writing():
+            if hasattr(self.prop, "close"):
+                self.prop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_edge(self, v1, v2, weight=1):
+        with self.lock.writing():
+            self.prop.add_edge(v1, v2, weight)
+
+    def add_edges(self, src, dst, weights=None):
+        with self.lock.writing():
+            self.prop.add_edges(src, dst, weights)
+
+    def remove_edge(self, v1, v2):
+        with self.lock.writing():
+            self.prop.remove_edge(v1, v2)
+
+    def update_weight(self, v1, v2, weight):
+        with self.lock.writing():
+            self.prop.update_weight(v1, v2, weight)
 
+    def add_vertex(self):
+        with self.lock.writing():
+            return self.prop.add_vertex()
+
+    def add_vertices(self, count):
+        with self.lock.writing():
+            return self.prop.add_vertices(count)
+
+    def remove_vertex(self, v):
+        with self.lock.writing():
+            self.prop.remove_vertex(v)
+
+    @read_locked
+    def snapshot(self):
+        snapshot = copy.copy(self)
+        snapshot.prop = self.prop.snapshot()
+        snapshot.lock = ReadWriteLock()
+        snapshot._cache = None
+        snapshot._stats = None
+        snapshot._connectivity = None
+        snapshot._connectivity_lock = threading.Lock()
+        return snapshot
+
+    def enable_cache(self, maxsize=1024, max_bytes=None):
+        self._cache = LRUCache(maxsize, max_bytes)
+
+    def disable_cache(self):
+        self._cache = None
+
+    def cache_stats(self):
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def enable_stats(self, callback=None):
+        self._stats = GraphStats(callback)
+        return self._stats
+
+    def disable_stats(self):
+        self._stats = None
+
+    def stats(self):
+        if self._stats is None:
+            return None
+        return self._stats.as_dict()
+
+    @_instrumented
+    @read_locked
     def breadth_first_search(self, source=0):
-        queue = Queue()
-        queue.put(source)
-        visit_order = []
-        while not queue.empty():
-            vertex = queue.get()
-            if self._visited[vertex] == 1:
-                continue
-            self._visited[vertex] = 1
-            visit_order.append(vertex)
-            for v in self.prop.get_adjacent_vertices(vertex):
-                if self._visited[v] != 1:
-                    queue.put(v)
-        self._visited = [0]*self.prop.num_vertices
-        return visit_order
+        return list(iter_bfs(self.prop, source))
 
+    @_instrumented
+    @read_locked
     def depth_first_search(self, current=0):
-        self._dfs_util(current)
-        visit_order = self.prop._visit_order
-        self._visit_order = []
-        self._visited = [0]*self.prop.num_vertices
-        return visit_order
-
-    def _dfs_util(self, current):
-        if self._visited[current] == 1:
-            return
-        self._visited[current] = 1
-        self._visit_order.append(current)
-        for v in self.prop.get_adjacent_vertices(current):
-            self._dfs_util(v)
-
-    def shortest_path_unweighted(self, source, destination):
-        distance_table = self._build_distance_table_unweighted(source)
-        path = [destination]
-        previous_vertex = distance_table[destination][1]
-        while previous_vertex is not None and previous_vertex is not source:
-            path = [previous_vertex]+path
-            previous_vertex = distance_table[previous_vertex][1]
-        if previous_vertex is None:
+        return list(iter_dfs(self.prop, current))
+
+    def iter_bfs(self, source=0):
+        return iter_bfs(self.prop, source)
+
+    def iter_dfs(self, current=0):
+        return iter_dfs(self.prop, current)
+
+    @_instrumented
+    @read_locked
+    @_cached
+    def shortest_path_unweighted(self, source, destination, strategy="bfs"):
+        if strategy == "bfs":
+            path = bfs(self.prop, source, destination).path_to(destination)
+        elif strategy == "bidirectional":
+            path, _ = bidirectional_bfs(self.prop, source, destination)
+        else:
+            raise ValueError(f"Unknown strategy {strategy}")
+        if len(path) == 0:
             raise ValueError(
                 f"No path between source: {source} and destination: {destination}")
-        return [source]+path
+        return path
 
-    def _build_distance_table_unweighted(self, source):
-        distance_table = {}
-        for i in range(self.prop.num_vertices):
-            distance_table[i] = (None, None)
-        distance_table[source] = (0, source)
-        queue = Queue()
-        queue.put(source)
-        while not queue.empty():
-            current_vertex = queue.get()
-            current_distance = distance_table[current_vertex][0]
-            for neighbor in self.prop.get_adjacent_vertices(current_vertex):
-                if distance_table[neighbor][0] is None:
-                    distance_table[neighbor] = (
-                        current_distance+1, current_vertex)
-                if len(self.prop.get_adjacent_vertices(neighbor)) > 0 and self._visited[neighbor] != 1:
-                    self._visited[neighbor] = 1
-                    queue.put(neighbor)
-        self._visited = [0]*self.prop.num_vertices
-        return distance_table
-
-    def shortest_path_weighted(self, source, destination):
-        distance_table = self._build_table_weighted(source)
-        path = [destination]
-        previous_vertex = distance_table[destination][1]
-        while previous_vertex is not source and previous_vertex is not None:
-            path = [previous_vertex]+path
-            previous_vertex = distance_table[previous_vertex][1]
-        if previous_vertex is None:
-            return []
-        return [source]+path
-
-    def _build_table_weighted(self, source):
-        distance_table = {}
-        for i in range(self.prop.num_vertices):
-            distance_table[i] = (None, None)
-        distance_table[source] = (0, source)
-        priority_queue = priority_dict()
-        priority_queue[source] = 0
-        while len(priority_queue.keys()) > 0:
-            current_vertex = priority_queue.pop_smallest()
-            current_distance = distance_table[current_vertex][0]
-            for neighbor in self.prop.get_adjacent_vertices(current_vertex):
-                distance = self.prop.get_edge_weight(
-                    current_vertex, neighbor) + current_distance
-                neighbor_distance = distance_table[neighbor][0]
-                if neighbor_distance is None or neighbor_distance > distance:
-                    distance_table[neighbor] = (distance, current_vertex)
-                    priority_queue[neighbor] = distance
-        return distance_table
+    @_instrumented
+    @read_locked
+    @_cached
+    def shortest_path_weighted(self, source, destination, strategy="dijkstra", heuristic=None):
+        path, _ = self._point_to_point(source, destination, strategy, heuristic)
+        return path
+
+    def _point_to_point(self, source, destination, strategy, heuristic):
+        if strategy == "dijkstra":
+            tree = dijkstra(self.prop, source, destination, self._queue_type)
+            return tree.path_to(destination), tree.cost_to(destination)
+        if strategy == "bidirectional":
+            return bidirectional_dijkstra(self.prop, source, destination, self._queue_type)
+        if strategy == "astar":
+            if heuristic is None:
+                raise ValueError("The astar strategy needs a heuristic")
+            return astar(self.prop, source, destination, heuristic, self._queue_type)
+        raise ValueError(f"Unknown strategy {strategy}")
+
+    @_instrumented
+    @read_locked
+    def shortest_path_tree(self, source, weighted=True):
+        if weighted:
+            return dijkstra(self.prop, source, queue_type=self._queue_type)
+        return bfs(self.prop, source)
+
+    async def breadth_first_search_async(self, source=0, **options):
+        return await bfs_async(self, source, **options)
+
+    async def depth_first_search_async(self, current=0, **options):
+        return await dfs_async(self, current, **options)
+
+    async def shortest_path_unweighted_async(self, source, destination, **options):
+        return await shortest_path_unweighted_async(self, source, destination, **options)
+
+    async def shortest_path_weighted_async(self, source, destination, **options):
+        return await shortest_path_weighted_async(self, source, destination, **options)
 
+    async def minimum_cost_async(self, source, destination, **options):
+        return await minimum_cost_async(self, source, destination, **options)
+
+    async def shortest_path_tree_async(self, source, weighted=True, **options):
+        return await shortest_path_tree_async(self, source, weighted, **options)
+
+    @read_locked
+    def batch_shortest_paths(self, sources, workers=None, weighted=True):
+        # the graph is copied to a file before returning, writes made while the results are iterated do not affect them
+        return batch_shortest_paths(self.prop, sources, workers, weighted)
+
+    @read_locked
+    def all_pairs_distances(self, workers=None, weighted=True):
+        return all_pairs_distances(self.prop, workers, weighted)
+
+    @_instrumented
+    @read_locked
     def topological_sort(self):
-        queue = Queue()
-        indegree_map = {}
+        queue = deque()
+        indegree_map = []
         for i in range(self.prop.num_vertices):
-            indegree_map[i] = self.prop.get_indegree(i)
+            indegree_map.append(self.prop.get_indegree(i))
             if indegree_map[i] == 0:
-                queue.put(i)
+                queue.append(i)
 
         sorted_list = []
-        while not queue.empty():
-            vertex = queue.get()
+        while queue:
+            vertex = queue.popleft()
             sorted_list.append(vertex)
             for v in self.prop.get_adjacent_vertices(vertex):
                 indegree_map[v] -= 1
                 if indegree_map[v] == 0:
-                    queue.put(v)
+                    queue.append(v)
         if len(sorted_list) != self.prop.num_vertices:
             raise ValueError("The graph has a cycle")
         return sorted_list
 
-    def minimum_cost(self, source, destination):
-        path = self.shortest_path_weighted(source, destination)
-        min_cost = 0
-        for i in range(0, len(path)-1):
-            min_cost += self.prop.get_edge_weight(path[i], path[i+1])
-        return min_cost
+    @_instrumented
+    @read_locked
+    @_cached
+    def minimum_cost(self, source, destination, strategy="dijkstra", heuristic=None):
+        _, cost = self._point_to_point(source, destination, strategy, heuristic)
+        if cost is None:
+            return 0
+        return cost
+
+    @_instrumented
+    @read_locked
+    def connected_components(self):
+        return connected_components(self.prop)
+
+    @_instrumented
+    @read_locked
+    def strongly_connected_components(self, strategy="tarjan"):
+        return strongly_connected_components(self.prop, strategy)
+
+    @read_locked
+    def are_connected(self, u, v):
+        if self._connectivity is None:
+            with self._connectivity_lock:
+                if self._connectivity is None:
+                    self._connectivity = ConnectivityIndex(self.prop)
+        return self._connectivity.are_connected(u, v)
 
-    def minimum_spanning_tree_prim(self, source):
-        pass
+    @_instrumented
+    @read_locked
+    def minimum_spanning_tree_prim(self, source=0):
+        return prim(self.prop, source, self._queue_type)
 
-    def minimum_spanning_tree_kruskal(self, source):
-        pass
+    @_instrumented
+    @read_locked
+    def minimum_spanning_tree_kruskal(self, source=None):
+        return kruskal(self.prop, source)
 
+    @read_locked
     def display(self):
         for i in range(self.prop.num_vertices):
             for j in self.prop.get_adjacent_vertices(i):
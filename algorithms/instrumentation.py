@@ -0,0 +1,133 @@
+'''
+Description: Opt in instrumentation of the graph algorithms. While enabled every instrumented call of Graph runs
+             against a CountingGraph proxy of the representation and a counting priority queue, and its wall time
+             and counters are added to a GraphStats object. While disabled the only cost is one attribute check per
+             call, the algorithms themselves are not changed.
+
+             Counters
+             neighbor_lookups  get_adjacent_vertices and get_incoming_vertices calls
+             edges_scanned     neighbors returned by those calls
+             edges_relaxed     get_edge_weight calls, one per edge relaxed by dijkstra, A* and prim
+             degree_lookups    get_indegree and get_outdegree calls
+             heap_pushes       priority queue inserts and priority changes
+             heap_pops         priority queue pop_smallest calls
+             heap_rebuilds     full heap rebuilds after the queue was created (always 0 for indexed_priority_dict)
+             vertices_settled  heap_pops for searches using a priority queue, neighbor_lookups otherwise
+
+Usage: stats=graph.enable_stats() #Starts collecting, returns the GraphStats object.
+       stats=graph.enable_stats(callback) #callback(name, seconds, counters) after every instrumented call.
+       graph.stats() #Returns {"counters": {...}, "calls": {name: {"count", "seconds", "max_seconds"}}}.
+       graph.disable_stats() #Stops collecting.
+       stats.reset() #Zeroes the counters and call timings.
+
+       CountingGraph(graph.prop, counters) and counting_queue(indexed_priority_dict, counters) can also be passed to
+       the functions of the algorithms package directly, counters being a Counters object.
+
+'''
+import threading
+
+COUNTERS = ("neighbor_lookups", "edges_scanned", "edges_relaxed", "degree_lookups",
+            "heap_pushes", "heap_pops", "heap_rebuilds", "vertices_settled")
+
+
+class Counters(object):
+    '''Counters of a single call, only touched by the thread making the call'''
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in COUNTERS}
+
+
+class GraphStats(object):
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._calls = {}
+
+    def record(self, name, seconds, counters):
+        '''Adds the wall time and counters of one call, then calls the callback'''
+        if counters.vertices_settled == 0:
+            counters.vertices_settled = counters.heap_pops or counters.neighbor_lookups
+        values = counters.as_dict()
+        with self._lock:
+            for key, value in values.items():
+                self._counters[key] += value
+            call = self._calls.setdefault(name, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            call["count"] += 1
+            call["seconds"] += seconds
+            call["max_seconds"] = max(call["max_seconds"], seconds)
+        if self.callback is not None:
+            self.callback(name, seconds, values)
+
+    def as_dict(self):
+        with self._lock:
+            return {"counters": dict(self._counters),
+                    "calls": {name: dict(call) for name, call in self._calls.items()}}
+
+
+class CountingGraph(object):
+    '''Proxy of a representation counting the lookups made through it, every other attribute is the representation's'''
+
+    def __init__(self, prop, counters):
+        self._prop = prop
+        self._counters = counters
+
+    def __getattr__(self, name):
+        return getattr(self._prop, name)
+
+    def get_adjacent_vertices(self, v):
+        neighbors = self._prop.get_adjacent_vertices(v)
+        self._counters.neighbor_lookups += 1
+        self._counters.edges_scanned += len(neighbors)
+        return neighbors
+
+    def get_incoming_vertices(self, v):
+        neighbors = self._prop.get_incoming_vertices(v)
+        self._counters.neighbor_lookups += 1
+        self._counters.edges_scanned += len(neighbors)
+        return neighbors
+
+    def get_edge_weight(self, v1, v2):
+        self._counters.edges_relaxed += 1
+        return self._prop.get_edge_weight(v1, v2)
+
+    def get_indegree(self, v):
+        self._counters.degree_lookups += 1
+        return self._prop.get_indegree(v)
+
+    def get_outdegree(self, v):
+        self._counters.degree_lookups += 1
+        return self._prop.get_outdegree(v)
+
+
+def counting_queue(queue_type, counters):
+    '''Returns a subclass of queue_type counting pushes, pops and rebuilds into counters'''
+    class CountingQueue(queue_type):
+        def __init__(self, *args, **kwargs):
+            self._counting = False
+            super(CountingQueue, self).__init__(*args, **kwargs)
+            self._counting = True
+
+        def __setitem__(self, key, val):
+            counters.heap_pushes += 1
+            super(CountingQueue, self).__setitem__(key, val)
+
+        def pop_smallest(self):
+            counters.heap_pops += 1
+            return super(CountingQueue, self).pop_smallest()
+
+        def _rebuild_heap(self):
+            if self._counting:
+                counters.heap_rebuilds += 1
+            super(CountingQueue, self)._rebuild_heap()
+
+    return CountingQueue
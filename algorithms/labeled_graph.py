@@ -0,0 +1,157 @@
+'''
+Description: Graph whose vertices are arbitrary hashable labels such as strings or UUIDs. Labels are interned into
+             the dense integer ids of an underlying Graph by a LabelIndex (help_ds/label_index.py) and translated only
+             when entering and leaving a call, every algorithm still runs on integers. A label seen for the first time
+             by add_edge or add_edges becomes a new vertex. Every call holds graph.lock from the translation of its
+             labels to the translation of its result, so a concurrent remove_vertex cannot renumber the ids in between.
+
+Usage: graph=LabeledGraph(rep="CSR",directed=False) #rep is any representation accepted by Graph.
+       graph=LabeledGraph.from_edges(["a","a","b"],["b","c","d"],[2,1,5]) #Interns every label, then adds all the edges at once.
+            EXAMPLES:
+            graph.add_vertex("e") #Adds the vertex "e" without edges.
+            graph.add_edge("a","b",2) #Adds an edge of weight 2 between "a" and "b", adding missing vertices.
+            graph.add_edges(["a","b"],["c","d"],[4,1]) #Adds a batch of edges with one bulk label translation.
+            graph.remove_edge("a","b"), graph.update_weight("a","c",3), graph.remove_vertex("e")
+            graph.get_adjacent_vertices("a") #Returns the labels adjacent to "a".
+            graph.get_edge_weight("a","c") #Returns the weight of the edge between "a" and "c".
+            graph.breadth_first_search("a"), graph.depth_first_search("a") #Labels in visit order.
+            graph.topological_sort() #Labels in topological order.
+            graph.shortest_path_weighted("a","d") #Labels along the path, accepts the strategy and heuristic of Graph,
+                                                  #the heuristic is called with integer ids.
+            graph.shortest_path_unweighted("a","d"), graph.minimum_cost("a","d"), graph.are_connected("a","d")
+            graph.minimum_spanning_tree_prim("a") #(label1, label2, weight) edges.
+            graph.ids_of(["a","d"]), graph.labels_of([0,3]) #Bulk translation between labels and ids.
+            graph.graph #The underlying integer Graph, graph.labels is the LabelIndex.
+
+'''
+from algorithms.graph_algorithms import Graph
+from help_ds.label_index import LabelIndex
+
+
+class LabeledGraph(object):
+    def __init__(self, rep="AdjacentMatrix", directed=False):
+        self.graph = Graph(0, rep, None, directed)
+        self.labels = LabelIndex()
+
+    @classmethod
+    def from_edges(cls, src, dst, weights=None, rep="AdjacentMatrix", directed=False):
+        labeled = cls.__new__(cls)
+        labeled.labels = LabelIndex()
+        src, dst = labeled.labels.intern_many(src), labeled.labels.intern_many(dst)
+        labeled.graph = Graph.from_edges(len(labeled.labels), src, dst, weights, rep, directed)
+        return labeled
+
+    def ids_of(self, labels):
+        with self.graph.lock.reading():
+            return self.labels.ids_of(labels)
+
+    def labels_of(self, ids):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(ids)
+
+    def add_vertex(self, label):
+        with self.graph.lock.writing():
+            if label not in self.labels:
+                self.labels.intern(label)
+                self.graph.add_vertex()
+
+    def add_edge(self, label1, label2, weight=1):
+        with self.graph.lock.writing():
+            v1, v2 = self._intern(label1), self._intern(label2)
+            self.graph.add_edge(v1, v2, weight)
+
+    def add_edges(self, src, dst, weights=None):
+        with self.graph.lock.writing():
+            src, dst = self.labels.intern_many(src), self.labels.intern_many(dst)
+            self._grow()
+            self.graph.add_edges(src, dst, weights)
+
+    def remove_edge(self, label1, label2):
+        with self.graph.lock.writing():
+            self.graph.remove_edge(self.labels.id_of(label1), self.labels.id_of(label2))
+
+    def update_weight(self, label1, label2, weight):
+        with self.graph.lock.writing():
+            self.graph.update_weight(self.labels.id_of(label1), self.labels.id_of(label2), weight)
+
+    def remove_vertex(self, label):
+        with self.graph.lock.writing():
+            v = self.labels.id_of(label)
+            self.graph.remove_vertex(v)
+            self.labels.remove_id(v)
+
+    def _intern(self, label):
+        v = self.labels.intern(label)
+        self._grow()
+        return v
+
+    def _grow(self):
+        '''Adds the vertices of newly interned labels to the graph'''
+        self.graph.add_vertices(len(self.labels)-self.graph.prop.num_vertices)
+
+    def get_adjacent_vertices(self, label):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(self.graph.prop.get_adjacent_vertices(self.labels.id_of(label)))
+
+    def get_incoming_vertices(self, label):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(self.graph.prop.get_incoming_vertices(self.labels.id_of(label)))
+
+    def get_edge_weight(self, label1, label2):
+        with self.graph.lock.reading():
+            return self.graph.prop.get_edge_weight(self.labels.id_of(label1), self.labels.id_of(label2))
+
+    def get_indegree(self, label):
+        with self.graph.lock.reading():
+            return self.graph.prop.get_indegree(self.labels.id_of(label))
+
+    def get_outdegree(self, label):
+        with self.graph.lock.reading():
+            return self.graph.prop.get_outdegree(self.labels.id_of(label))
+
+    def breadth_first_search(self, source):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(self.graph.breadth_first_search(self.labels.id_of(source)))
+
+    def depth_first_search(self, source):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(self.graph.depth_first_search(self.labels.id_of(source)))
+
+    def topological_sort(self):
+        with self.graph.lock.reading():
+            return self.labels.labels_of(self.graph.topological_sort())
+
+    def shortest_path_unweighted(self, source, destination, strategy="bfs"):
+        with self.graph.lock.reading():
+            source, destination = self.labels.id_of(source), self.labels.id_of(destination)
+            return self.labels.labels_of(self.graph.shortest_path_unweighted(source, destination, strategy))
+
+    def shortest_path_weighted(self, source, destination, strategy="dijkstra", heuristic=None):
+        with self.graph.lock.reading():
+            source, destination = self.labels.id_of(source), self.labels.id_of(destination)
+            return self.labels.labels_of(self.graph.shortest_path_weighted(source, destination, strategy, heuristic))
+
+    def minimum_cost(self, source, destination, strategy="dijkstra", heuristic=None):
+        with self.graph.lock.reading():
+            source, destination = self.labels.id_of(source), self.labels.id_of(destination)
+            return self.graph.minimum_cost(source, destination, strategy, heuristic)
+
+    def are_connected(self, label1, label2):
+        with self.graph.lock.reading():
+            return self.graph.are_connected(self.labels.id_of(label1), self.labels.id_of(label2))
+
+    def minimum_spanning_tree_prim(self, source):
+        with self.graph.lock.reading():
+            return self._label_edges(self.graph.minimum_spanning_tree_prim(self.labels.id_of(source)))
+
+    def minimum_spanning_tree_kruskal(self, source=None):
+        with self.graph.lock.reading():
+            if source is not None:
+                source = self.labels.id_of(source)
+            return self._label_edges(self.graph.minimum_spanning_tree_kruskal(source))
+
+    def _label_edges(self, edges):
+        if len(edges) == 0:
+            return []
+        v1, v2, weights = zip(*edges)
+        return list(zip(self.labels.labels_of(v1), self.labels.labels_of(v2), weights))
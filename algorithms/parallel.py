@@ -0,0 +1,88 @@
+'''
+Description: Runs many single source searches in parallel on a concurrent.futures.ProcessPoolExecutor.
+             The graph is written once to the binary file format of storage/binary_format.py and every worker maps
+             that file read only, so workers share one copy of the graph through the page cache instead of each
+             unpickling the representation. Graphs already loaded with Graph.load reuse their own file.
+             batch_shortest_paths writes the file before it returns, so writes made to the graph while the results
+             are iterated do not reach the workers.
+             Sources are sent to the workers in chunks of at most chunksize sources, and only two chunks per worker
+             are in flight at a time, so closing the generator early stops the batch after those chunks.
+
+Usage: for source, distances in batch_shortest_paths(graph.prop, [0, 5, 9], workers=4):
+           distances[v] #Distance from source to v, None when v is unreachable.
+       all_pairs_distances(graph.prop, workers=4) #List of the distance lists of every source.
+
+       weighted=True runs dijkstra, weighted=False runs bfs and counts edges.
+
+'''
+import os
+import tempfile
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from storage.binary_format import load_graph, save_graph
+from representations.mapped_csr import MappedCSR
+from algorithms.shortest_path_tree import bfs, dijkstra
+
+_worker_graph = None
+# every source of a chunk is searched before the chunk returns, which bounds the work left when a batch is closed
+MAX_CHUNKSIZE = 16
+
+
+def batch_shortest_paths(prop, sources, workers=None, weighted=True, chunksize=None):
+    sources = list(sources)
+    if chunksize is None:
+        chunksize = max(1, min(MAX_CHUNKSIZE, len(sources)//(4*(workers or os.cpu_count() or 1))))
+    if isinstance(prop, MappedCSR):
+        return _batch(prop.path, False, sources, workers, weighted, chunksize)
+    file, path = tempfile.mkstemp(suffix=".bin")
+    os.close(file)
+    try:
+        save_graph(prop, path)
+    except BaseException:
+        os.remove(path)
+        raise
+    results = _batch(path, True, sources, workers, weighted, chunksize)
+    # a generator that is never started does not run its finally block
+    weakref.finalize(results, _remove, path)
+    return results
+
+
+def _batch(path, temporary, sources, workers, weighted, chunksize):
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(path,))
+    in_flight = 2*(workers or os.cpu_count() or 1)
+    pending = deque()
+    try:
+        for start in range(0, len(sources), chunksize):
+            pending.append(executor.submit(_shortest_distances, sources[start:start+chunksize], weighted))
+            if len(pending) >= in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # closing the generator early drops the chunks no worker has started
+        executor.shutdown(wait=True, cancel_futures=True)
+        if temporary:
+            _remove(path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def all_pairs_distances(prop, workers=None, weighted=True):
+    return [distance for _, distance in
+            batch_shortest_paths(prop, range(prop.num_vertices), workers, weighted)]
+
+
+def _init_worker(path):
+    global _worker_graph
+    _worker_graph = load_graph(path)
+
+
+def _shortest_distances(sources, weighted):
+    search = dijkstra if weighted else bfs
+    return [(source, search(_worker_graph, source).distances()) for source in sources]
@@ -0,0 +1,143 @@
+'''
+Description: Point to point shortest path searches that settle far fewer vertices than a full bfs or dijkstra
+             when only one destination matters. The searches keep their state in dicts sized by the vertices they
+             touch rather than by num_vertices. Backward searches walk get_incoming_vertices, a directed
+             AdjacentSet built with reverse_index=False scans every vertex for them.
+
+Usage: bidirectional_bfs(graph.prop, 0, 4) #Fewest edges, grows a bfs from both ends and stops where they meet.
+       bidirectional_dijkstra(graph.prop, 0, 4) #Least weight, runs dijkstra from both ends.
+       astar(graph.prop, 0, 4, heuristic) #Least weight, dijkstra guided by heuristic(v, destination).
+       astar(graph.prop, 0, 4, euclidean_heuristic(coordinates)) #coordinates[v] is a tuple of numbers.
+
+       Every search returns a tuple (path, cost), ([], None) when destination cannot be reached.
+       The dijkstra based searches take an optional queue_type, any priority_dict compatible class.
+       The heuristic must never overestimate the remaining cost, for euclidean_heuristic every edge weight must be at
+       least the distance between the coordinates of its endpoints.
+
+'''
+from math import dist
+from help_ds.indexed_priority_dict import indexed_priority_dict
+from algorithms.traversal import _check_vertex
+
+
+def bidirectional_bfs(prop, source, destination):
+    _check_vertex(prop, source)
+    _check_vertex(prop, destination)
+    if source == destination:
+        return [source], 0
+    forward_parent, backward_parent = {source: None}, {destination: None}
+    forward_frontier, backward_frontier = [source], [destination]
+    while forward_frontier and backward_frontier:
+        # expanding a whole level of the smaller frontier, the first vertex seen by both searches is on a shortest path
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_level(
+                forward_frontier, forward_parent, backward_parent, prop.get_adjacent_vertices)
+        else:
+            backward_frontier, meeting = _expand_level(
+                backward_frontier, backward_parent, forward_parent, prop.get_incoming_vertices)
+        if meeting is not None:
+            path = _join(meeting, forward_parent, backward_parent)
+            return path, len(path)-1
+    return [], None
+
+
+def _expand_level(frontier, parent, other_parent, get_neighbors):
+    next_frontier = []
+    for vertex in frontier:
+        for neighbor in get_neighbors(vertex):
+            if neighbor in parent:
+                continue
+            parent[neighbor] = vertex
+            if neighbor in other_parent:
+                return next_frontier, neighbor
+            next_frontier.append(neighbor)
+    return next_frontier, None
+
+
+def bidirectional_dijkstra(prop, source, destination, queue_type=indexed_priority_dict):
+    _check_vertex(prop, source)
+    _check_vertex(prop, destination)
+    if source == destination:
+        return [source], 0
+    get_edge_weight = prop.get_edge_weight
+    distance = ({source: 0}, {destination: 0})
+    parent = ({source: None}, {destination: None})
+    settled = (set(), set())
+    queues = (queue_type({source: 0}), queue_type({destination: 0}))
+    get_neighbors = (prop.get_adjacent_vertices, prop.get_incoming_vertices)
+    best, meeting = None, None
+    while queues[0] and queues[1]:
+        if best is not None and queues[0][queues[0].smallest()]+queues[1][queues[1].smallest()] >= best:
+            break
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        other = 1-side
+        current_vertex = queues[side].pop_smallest()
+        settled[side].add(current_vertex)
+        current_distance = distance[side][current_vertex]
+        for neighbor in get_neighbors[side](current_vertex):
+            if neighbor in settled[side]:
+                continue
+            if side == 0:
+                candidate = current_distance+get_edge_weight(current_vertex, neighbor)
+            else:
+                candidate = current_distance+get_edge_weight(neighbor, current_vertex)
+            neighbor_distance = distance[side].get(neighbor)
+            if neighbor_distance is None or neighbor_distance > candidate:
+                distance[side][neighbor] = candidate
+                parent[side][neighbor] = current_vertex
+                queues[side][neighbor] = candidate
+            if neighbor in distance[other]:
+                total = distance[side][neighbor]+distance[other][neighbor]
+                if best is None or total < best:
+                    best, meeting = total, neighbor
+    if meeting is None:
+        return [], None
+    return _join(meeting, parent[0], parent[1]), best
+
+
+def astar(prop, source, destination, heuristic, queue_type=indexed_priority_dict):
+    _check_vertex(prop, source)
+    _check_vertex(prop, destination)
+    get_adjacent_vertices, get_edge_weight = prop.get_adjacent_vertices, prop.get_edge_weight
+    distance = {source: 0}
+    parent = {source: None}
+    priority_queue = queue_type()
+    priority_queue[source] = heuristic(source, destination)
+    while priority_queue:
+        current_vertex = priority_queue.pop_smallest()
+        if current_vertex == destination:
+            return _path(destination, parent), distance[destination]
+        current_distance = distance[current_vertex]
+        for neighbor in get_adjacent_vertices(current_vertex):
+            candidate = current_distance+get_edge_weight(current_vertex, neighbor)
+            neighbor_distance = distance.get(neighbor)
+            if neighbor_distance is None or neighbor_distance > candidate:
+                distance[neighbor] = candidate
+                parent[neighbor] = current_vertex
+                priority_queue[neighbor] = candidate+heuristic(neighbor, destination)
+    return [], None
+
+
+def euclidean_heuristic(coordinates):
+    '''Returns a heuristic estimating the cost between two vertices by the distance between their coordinates'''
+    def heuristic(v, destination):
+        return dist(coordinates[v], coordinates[destination])
+    return heuristic
+
+
+def _path(vertex, parent):
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parent[vertex]
+    path.reverse()
+    return path
+
+
+def _join(meeting, forward_parent, backward_parent):
+    path = _path(meeting, forward_parent)
+    vertex = backward_parent[meeting]
+    while vertex is not None:
+        path.append(vertex)
+        vertex = backward_parent[vertex]
+    return path
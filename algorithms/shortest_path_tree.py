@@ -0,0 +1,137 @@
+'''
+Description: Single source shortest path trees. One bfs or dijkstra run from a source records the distance and the
+             previous vertex of every reached vertex, after which any number of path_to/cost_to lookups are answered
+             from the tree without searching again. Passing a destination stops the search as soon as that vertex
+             is settled, the distances of vertices settled before it are final.
+
+Usage: tree = dijkstra(graph.prop, 0) #Shortest path tree of a weighted graph.
+       tree = bfs(graph.prop, 0) #Shortest path tree counting edges.
+       tree.path_to(4) #Returns the list of vertices from the source to 4, [] when 4 is unreachable.
+       tree.cost_to(4) #Returns the length of that path, None when 4 is unreachable.
+       tree.has_path_to(4) #Returns True when 4 is reachable from the source.
+       tree.distances() #Returns the distance to every vertex, None for unreachable vertices.
+       dijkstra(graph.prop, 0, queue_type=priority_dict) #queue_type is any priority_dict compatible class.
+
+       bfs_steps and dijkstra_steps are the same searches written as generators that pause every yield_every units
+       of work, a neighbor examined or an entry of a matrix row scanned, and return the tree when they finish.
+       bfs and dijkstra run them without pausing, algorithms/async_queries.py resumes them from an event loop.
+
+'''
+import sys
+from collections import deque
+from help_ds.indexed_priority_dict import indexed_priority_dict
+from algorithms.traversal import _check_vertex
+
+
+class ShortestPathTree(object):
+    def __init__(self, source, distance, previous):
+        self.source = source
+        self._distance = distance
+        self._previous = previous
+
+    def has_path_to(self, destination):
+        return self._distance[destination] is not None
+
+    def cost_to(self, destination):
+        return self._distance[destination]
+
+    def distances(self):
+        '''Returns the list of distances from the source, None for unreachable vertices'''
+        return list(self._distance)
+
+    def path_to(self, destination):
+        if self._distance[destination] is None:
+            return []
+        path = [destination]
+        previous = self._previous
+        while destination != self.source:
+            destination = previous[destination]
+            path.append(destination)
+        path.reverse()
+        return path
+
+
+def bfs(prop, source, destination=None):
+    return _finish(bfs_steps(prop, source, destination))
+
+
+def dijkstra(prop, source, destination=None, queue_type=indexed_priority_dict):
+    return _finish(dijkstra_steps(prop, source, destination, queue_type))
+
+
+def bfs_steps(prop, source, destination=None, yield_every=None):
+    _check_vertex(prop, source)
+    if destination is not None:
+        _check_vertex(prop, destination)
+    if yield_every is None:
+        yield_every = sys.maxsize
+    distance = [None]*prop.num_vertices
+    previous = [None]*prop.num_vertices
+    distance[source] = 0
+    get_adjacent_vertices = prop.get_adjacent_vertices
+    scan_cost = prop.neighbor_scan_cost()
+    queue = deque([source])
+    work = 0
+    while queue:
+        current_vertex = queue.popleft()
+        if current_vertex == destination:
+            break
+        next_distance = distance[current_vertex]+1
+        neighbors = get_adjacent_vertices(current_vertex)
+        for neighbor in neighbors:
+            if distance[neighbor] is None:
+                distance[neighbor] = next_distance
+                previous[neighbor] = current_vertex
+                queue.append(neighbor)
+        work += scan_cost+len(neighbors)
+        if work >= yield_every:
+            work = 0
+            yield
+    return ShortestPathTree(source, distance, previous)
+
+
+def dijkstra_steps(prop, source, destination=None, queue_type=indexed_priority_dict, yield_every=None):
+    _check_vertex(prop, source)
+    if destination is not None:
+        _check_vertex(prop, destination)
+    if yield_every is None:
+        yield_every = sys.maxsize
+    distance = [None]*prop.num_vertices
+    previous = [None]*prop.num_vertices
+    distance[source] = 0
+    get_adjacent_vertices, get_edge_weight = prop.get_adjacent_vertices, prop.get_edge_weight
+    scan_cost = prop.neighbor_scan_cost()
+    settled = bytearray(prop.num_vertices)
+    priority_queue = queue_type()
+    priority_queue[source] = 0
+    work = 0
+    while priority_queue:
+        current_vertex = priority_queue.pop_smallest()
+        settled[current_vertex] = 1
+        if current_vertex == destination:
+            break
+        current_distance = distance[current_vertex]
+        neighbors = get_adjacent_vertices(current_vertex)
+        for neighbor in neighbors:
+            if settled[neighbor]:
+                continue
+            candidate = current_distance+get_edge_weight(current_vertex, neighbor)
+            neighbor_distance = distance[neighbor]
+            if neighbor_distance is None or neighbor_distance > candidate:
+                distance[neighbor] = candidate
+                previous[neighbor] = current_vertex
+                priority_queue[neighbor] = candidate
+        work += scan_cost+len(neighbors)
+        if work >= yield_every:
+            work = 0
+            yield
+    return ShortestPathTree(source, distance, previous)
+
+
+def _finish(steps):
+    '''Runs a search generator to the end and returns its result'''
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
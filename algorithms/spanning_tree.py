@@ -0,0 +1,73 @@
+'''
+Description: Minimum spanning trees of undirected graphs, returned as lists of (v1, v2, weight) edges.
+
+Usage: prim(graph.prop, 0) #Grows the minimum spanning tree of the component of 0 with an indexed priority queue.
+       kruskal(graph.prop) #Minimum spanning forest of the whole graph, one tree per connected component.
+       kruskal(graph.prop, 0) #Only the tree of the component of 0.
+
+'''
+from array import array
+from help_ds.disjoint_set import DisjointSet
+from help_ds.indexed_priority_dict import indexed_priority_dict
+from algorithms.traversal import _check_vertex
+
+
+def prim(prop, source=0, queue_type=indexed_priority_dict):
+    _check_undirected(prop)
+    _check_vertex(prop, source)
+    get_adjacent_vertices, get_edge_weight = prop.get_adjacent_vertices, prop.get_edge_weight
+    in_tree = bytearray(prop.num_vertices)
+    parent = [None]*prop.num_vertices
+    priority_queue = queue_type()
+    priority_queue[source] = 0
+    tree = []
+    while priority_queue:
+        weight = priority_queue[priority_queue.smallest()]
+        current_vertex = priority_queue.pop_smallest()
+        in_tree[current_vertex] = 1
+        if current_vertex != source:
+            tree.append((parent[current_vertex], current_vertex, weight))
+        for neighbor in get_adjacent_vertices(current_vertex):
+            if in_tree[neighbor]:
+                continue
+            edge_weight = get_edge_weight(current_vertex, neighbor)
+            if neighbor not in priority_queue or priority_queue[neighbor] > edge_weight:
+                parent[neighbor] = current_vertex
+                priority_queue[neighbor] = edge_weight
+    return tree
+
+
+def kruskal(prop, source=None):
+    _check_undirected(prop)
+    if source is not None:
+        _check_vertex(prop, source)
+    src, dst, weights = _edge_arrays(prop)
+    # one bulk sort of edge indices by weight instead of a list of edge tuples
+    order = sorted(range(len(src)), key=weights.__getitem__)
+    components = DisjointSet(prop.num_vertices)
+    forest = []
+    for i in order:
+        if components.union(src[i], dst[i]):
+            forest.append((src[i], dst[i], weights[i]))
+            if components.num_sets == 1:
+                break
+    if source is not None:
+        root = components.find(source)
+        forest = [edge for edge in forest if components.find(edge[0]) == root]
+    return forest
+
+
+def _edge_arrays(prop):
+    src, dst, weights = array('l'), array('l'), []
+    for v1 in range(prop.num_vertices):
+        for v2 in prop.get_adjacent_vertices(v1):
+            if v1 < v2:
+                src.append(v1)
+                dst.append(v2)
+                weights.append(prop.get_edge_weight(v1, v2))
+    return src, dst, weights
+
+
+def _check_undirected(prop):
+    if prop.directed:
+        raise ValueError("Minimum spanning trees are only defined for undirected graphs")
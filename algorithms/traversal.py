@@ -0,0 +1,49 @@
+'''
+Description: Iterative breadth first and depth first traversals over any representation of the Graph interface.
+             The visited state is a bytearray local to each call and the traversals are generators, so callers can
+             stop early without the whole visit order being built, and deep graphs never hit the recursion limit.
+
+Usage: for vertex in iter_bfs(graph.prop, 0): #Yields vertices in bfs order starting from vertex 0.
+       for vertex in iter_dfs(graph.prop, 0): #Yields vertices in dfs preorder starting from vertex 0.
+
+'''
+from collections import deque
+
+
+def iter_bfs(prop, source=0):
+    _check_vertex(prop, source)
+    get_adjacent_vertices = prop.get_adjacent_vertices
+    visited = bytearray(prop.num_vertices)
+    visited[source] = 1
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        yield vertex
+        for v in get_adjacent_vertices(vertex):
+            if not visited[v]:
+                visited[v] = 1
+                queue.append(v)
+
+
+def iter_dfs(prop, source=0):
+    _check_vertex(prop, source)
+    get_adjacent_vertices = prop.get_adjacent_vertices
+    visited = bytearray(prop.num_vertices)
+    visited[source] = 1
+    yield source
+    # one neighbor iterator per vertex on the current path, mirroring the frames of a recursive dfs
+    stack = [iter(get_adjacent_vertices(source))]
+    while stack:
+        for v in stack[-1]:
+            if not visited[v]:
+                visited[v] = 1
+                yield v
+                stack.append(iter(get_adjacent_vertices(v)))
+                break
+        else:
+            stack.pop()
+
+
+def _check_vertex(prop, v):
+    if v >= prop.num_vertices or v < 0:
+        raise ValueError(f"Cannot access vertex {v}")
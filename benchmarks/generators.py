@@ -0,0 +1,67 @@
+'''
+Description: Seeded synthetic graph generators for the benchmarks. Every generator returns parallel src, dst and
+             weights lists ready for graph.add_edges, with every edge oriented from the smaller to the larger vertex
+             so the same edges also form a directed acyclic graph that topological_sort accepts.
+
+Usage: src, dst, weights = grid(10000) #Each vertex joined to its right and lower neighbor on a square grid.
+       src, dst, weights = erdos_renyi(10000, degree=8) #num_vertices*degree/2 edges between uniformly random pairs.
+       src, dst, weights = power_law(10000, degree=8) #Barabasi-Albert preferential attachment, degree/2 edges per vertex.
+
+'''
+import random
+from math import isqrt
+
+
+def grid(num_vertices, seed=0):
+    generator = random.Random(seed)
+    side = isqrt(num_vertices-1)+1 if num_vertices > 1 else 1
+    src, dst = [], []
+    for v in range(num_vertices):
+        if (v+1) % side and v+1 < num_vertices:
+            src.append(v)
+            dst.append(v+1)
+        if v+side < num_vertices:
+            src.append(v)
+            dst.append(v+side)
+    return src, dst, _weights(generator, len(src))
+
+
+def erdos_renyi(num_vertices, degree=8, seed=0):
+    '''G(n, m) with m = num_vertices*degree/2, the sparse form of G(n, p) with p = degree/num_vertices'''
+    generator = random.Random(seed)
+    src, dst = [], []
+    if num_vertices < 2:
+        return src, dst, []
+    for _ in range(num_vertices*degree//2):
+        v1, v2 = generator.randrange(num_vertices), generator.randrange(num_vertices)
+        while v1 == v2:
+            v2 = generator.randrange(num_vertices)
+        src.append(min(v1, v2))
+        dst.append(max(v1, v2))
+    return src, dst, _weights(generator, len(src))
+
+
+def power_law(num_vertices, degree=8, seed=0):
+    '''Barabasi-Albert graph, every new vertex attaches to degree/2 earlier vertices chosen proportionally to their degree'''
+    generator = random.Random(seed)
+    attach = max(1, degree//2)
+    src, dst = [], []
+    # every vertex appears in endpoints once per edge it has, so a uniform pick from it is a pick by degree
+    endpoints = list(range(min(attach, num_vertices)))
+    for v in range(attach, num_vertices):
+        targets = set()
+        while len(targets) < attach:
+            targets.add(generator.choice(endpoints))
+        for u in targets:
+            src.append(u)
+            dst.append(v)
+        endpoints.extend(targets)
+        endpoints.extend([v]*attach)
+    return src, dst, _weights(generator, len(src))
+
+
+def _weights(generator, count):
+    return [generator.randint(1, 100) for _ in range(count)]
+
+
+GENERATORS = {"grid": grid, "erdos_renyi": erdos_renyi, "power_law": power_law}
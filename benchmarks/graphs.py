@@ -0,0 +1,183 @@
+'''
+Description: Reproducible benchmarks of the graph representations and algorithms on synthetic graphs (see
+             benchmarks/generators.py). Every run times building the graph edge by edge, neighbor and indegree
+             lookups of every vertex, bfs, dfs, topological sort and a full dijkstra from vertex 0, measures the
+             peak memory allocated by each operation with tracemalloc and writes everything to a JSON file so the
+             results of two releases can be compared with --compare.
+             The graphs are directed with every edge from the smaller to the larger vertex, so topological_sort
+             accepts them. AdjacentMatrix stores num_vertices^2 entries and is skipped above --max-matrix-vertices.
+
+Usage: python -m benchmarks.graphs [--sizes 1000 10000 100000 1000000] [--generators grid erdos_renyi power_law]
+                                   [--reps AdjacentMatrix AdjacentSet] [--degree 8] [--repeat 3] [--seed 0]
+                                   [--max-matrix-vertices 5000] [--no-memory] [--output results.json]
+                                   [--compare baseline.json]
+
+       Operations
+       add_edge               builds the graph with one prop.add_edge call per edge
+       get_adjacent_vertices  calls prop.get_adjacent_vertices on every vertex
+       get_indegree           calls prop.get_indegree on every vertex
+       bfs, dfs               graph.breadth_first_search(0) and graph.depth_first_search(0)
+       topological_sort       graph.topological_sort()
+       dijkstra               graph.shortest_path_tree(0), dijkstra without an early exit
+
+       Every timing is the best of --repeat runs, peak_bytes comes from one extra run under tracemalloc so that tracing
+       does not slow the timed runs. --compare prints the ratio of every timing to the matching one in the baseline file.
+
+'''
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from algorithms.graph_algorithms import Graph
+from benchmarks.generators import GENERATORS
+
+OPERATIONS = ("add_edge", "get_adjacent_vertices", "get_indegree", "bfs", "dfs", "topological_sort", "dijkstra")
+
+
+def build(num_vertices, rep, edges):
+    graph = Graph(num_vertices, rep, directed=True)
+    add_edge = graph.prop.add_edge
+    for v1, v2, weight in zip(*edges):
+        add_edge(v1, v2, weight)
+    return graph
+
+
+def operation(name, graph):
+    '''Returns a function running the operation name on graph'''
+    prop = graph.prop
+    if name == "get_adjacent_vertices":
+        def run():
+            for v in range(prop.num_vertices):
+                prop.get_adjacent_vertices(v)
+    elif name == "get_indegree":
+        def run():
+            for v in range(prop.num_vertices):
+                prop.get_indegree(v)
+    elif name == "bfs":
+        def run():
+            graph.breadth_first_search(0)
+    elif name == "dfs":
+        def run():
+            graph.depth_first_search(0)
+    elif name == "topological_sort":
+        def run():
+            graph.topological_sort()
+    elif name == "dijkstra":
+        def run():
+            graph.shortest_path_tree(0)
+    else:
+        raise ValueError(f"Unknown operation {name}")
+    return run
+
+
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter()-start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(generator, num_vertices, rep, edges, repeat, memory):
+    '''Yields one result dict per operation'''
+    result = {"generator": generator, "vertices": num_vertices, "edges": len(edges[0]), "rep": rep}
+
+    def build_graph():
+        return build(num_vertices, rep, edges)
+
+    yield dict(result, operation="add_edge", seconds=best_time(build_graph, repeat),
+               peak_bytes=peak_memory(build_graph) if memory else None)
+    graph = build_graph()
+    for name in OPERATIONS[1:]:
+        function = operation(name, graph)
+        yield dict(result, operation=name, seconds=best_time(function, repeat),
+                   peak_bytes=peak_memory(function) if memory else None)
+
+
+def run(sizes, generators, reps, degree=8, repeat=3, seed=0, max_matrix_vertices=5000, memory=True, log=None):
+    results = []
+    for generator in generators:
+        for num_vertices in sizes:
+            if generator == "grid":
+                edges = GENERATORS[generator](num_vertices, seed=seed)
+            else:
+                edges = GENERATORS[generator](num_vertices, degree=degree, seed=seed)
+            for rep in reps:
+                if rep in ("AdjacentMatrix", "NumpyMatrix") and num_vertices > max_matrix_vertices:
+                    results.append({"generator": generator, "vertices": num_vertices, "edges": len(edges[0]),
+                                    "rep": rep, "skipped": f"more than {max_matrix_vertices} vertices"})
+                    continue
+                for result in benchmark(generator, num_vertices, rep, edges, repeat, memory):
+                    results.append(result)
+                    if log is not None:
+                        log(result)
+    return results
+
+
+def metadata(args):
+    return {"python": sys.version.split()[0], "implementation": platform.python_implementation(),
+            "platform": platform.platform(), "machine": platform.machine(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "degree": args.degree, "repeat": args.repeat, "seed": args.seed}
+
+
+def _key(result):
+    return result["generator"], result["vertices"], result["rep"], result["operation"]
+
+
+def compare(results, baseline):
+    '''Returns (key, seconds, baseline seconds) for every operation timed in both runs'''
+    old = {_key(result): result["seconds"] for result in baseline if "seconds" in result}
+    return [(_key(result), result["seconds"], old[_key(result)])
+            for result in results if "seconds" in result and _key(result) in old]
+
+
+def _print_result(result):
+    peak = "" if result["peak_bytes"] is None else f"{result['peak_bytes']/2**20:10.2f} MiB"
+    print(f"{result['generator']:12}{result['vertices']:>9}  {result['rep']:16}{result['operation']:24}"
+          f"{result['seconds']*1000:12.2f} ms{peak}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--reps", nargs="+", default=["AdjacentMatrix", "AdjacentSet"])
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-matrix-vertices", type=int, default=5000)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.generators, args.reps, args.degree, args.repeat, args.seed,
+                  args.max_matrix_vertices, not args.no_memory, _print_result)
+    with open(args.output, "w") as file:
+        json.dump({"metadata": metadata(args), "results": results}, file, indent=1)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        for (generator, vertices, rep, name), seconds, old_seconds in compare(results, baseline):
+            print(f"{generator:12}{vertices:>9}  {rep:16}{name:24}{seconds/old_seconds:8.2f}x of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+'''
+Description: Microbenchmarks comparing priority_dict (lazy deletion, full heapify whenever a priority changes)
+             with indexed_priority_dict (position indexed heap with O(log n) decrease key).
+
+Usage: python -m benchmarks.priority_queues [--size 2000] [--repeat 3]
+
+       decrease_key  inserts size keys, then lowers every priority once
+       pop_reinsert  pops the smallest key and inserts it back with a larger priority, which lazy deletion
+                     handles without a rebuild, the worst case for the indexed heap
+       dijkstra      runs the Dijkstra loop of Graph._build_table_weighted on a random sparse graph
+
+'''
+import argparse
+import random
+from time import perf_counter
+from help_ds.priority_dict import priority_dict
+from help_ds.indexed_priority_dict import indexed_priority_dict
+
+QUEUES = (priority_dict, indexed_priority_dict)
+
+
+def decrease_key(queue_type, size):
+    queue = queue_type()
+    for k in range(size):
+        queue[k] = size+k
+    for k in range(size):
+        queue[k] = size-k
+    while queue:
+        queue.pop_smallest()
+
+
+def pop_reinsert(queue_type, size):
+    queue = queue_type()
+    for k in range(size):
+        queue[k] = k
+    for step in range(size):
+        k = queue.pop_smallest()
+        queue[k] = size+step
+
+
+def dijkstra(queue_type, adjacency):
+    distance = [None]*len(adjacency)
+    distance[0] = 0
+    queue = queue_type()
+    queue[0] = 0
+    while queue:
+        vertex = queue.pop_smallest()
+        for neighbor, weight in adjacency[vertex]:
+            candidate = distance[vertex]+weight
+            if distance[neighbor] is None or distance[neighbor] > candidate:
+                distance[neighbor] = candidate
+                queue[neighbor] = candidate
+    return distance
+
+
+def random_adjacency(size, degree, seed=0):
+    generator = random.Random(seed)
+    adjacency = [[] for _ in range(size)]
+    for v in range(size):
+        for _ in range(degree):
+            adjacency[v].append(
+                (generator.randrange(size), generator.randint(1, 100)))
+    return adjacency
+
+
+def best_time(function, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        function(*args)
+        elapsed = perf_counter()-start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(size, repeat):
+    adjacency = random_adjacency(size, 8)
+    results = {}
+    for name, function, argument in (("decrease_key", decrease_key, size),
+                                     ("pop_reinsert", pop_reinsert, size),
+                                     ("dijkstra", dijkstra, adjacency)):
+        results[name] = {queue_type.__name__: best_time(function, queue_type, argument, repeat=repeat)
+                         for queue_type in QUEUES}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for name, timings in run(args.size, args.repeat).items():
+        baseline = timings[priority_dict.__name__]
+        for queue_name, elapsed in timings.items():
+            print(f"{name:14}{queue_name:24}{elapsed*1000:10.2f} ms{baseline/elapsed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,27 +8,164 @@ Interface Abstract Methods: 1. add_edge(self,v1,v2,weight=1)
                             3. get_indegree(self,v)
                             4. get_outdegree(self,v)
                             5. get_edge_weight(self,v1,v2)
-                            6. display(self)
-                            
+                            6. get_incoming_vertices(self,v)
+                            7. remove_edge(self,v1,v2)
+                            8. add_vertex(self)
+                            9. remove_vertex(self,v)
+                            10. display(self)
+
+Interface Methods: 1. add_edges(self,src,dst,weights=None) #bulk insertion, validates every vertex once before adding
+                   2. snapshot(self) #read only copy sharing storage with the graph, copied lazily when the graph is written
+                   3. has_edge(self,v1,v2)
+                   4. update_weight(self,v1,v2,weight) #changes the weight of an existing edge
+                   5. subscribe(self,listener) #listener(event,*args) is called after every mutation, see _changed
+                   6. unsubscribe(self,listener)
+                   7. add_vertices(self,count) #bulk insertion of isolated vertices, returns the range of their ids
+                   8. neighbor_scan_cost(self) #entries read by get_adjacent_vertices besides the neighbors it returns
+                   9. cheap_snapshots(self) #True when a snapshot costs the next write O(V) or less
+
 '''
 import abc
+import copy
 
 
 class Graph(abc.ABC):
     def __init__(self, num_vertices, directed=False):
         self.num_vertices = num_vertices
         self.directed = directed
+        # bumped on every mutation so that derived results (e.g. cached paths) can tell they are stale
+        self.version = 0
+        self._read_only = False
+        self._shared = False
+        self._listeners = []
 
     @abc.abstractmethod
     def add_edge(self, v1, v2, weight=1):
         '''Adds an edge to the graph'''
         pass
 
+    def add_edges(self, src, dst, weights=None):
+        '''Adds the edges src[i]-->dst[i] with weight weights[i] (1 when weights is None)'''
+        src, dst, weights = self._validate_edges(src, dst, weights)
+        for v1, v2, weight in zip(src, dst, weights):
+            self.add_edge(v1, v2, weight)
+
+    @abc.abstractmethod
+    def remove_edge(self, v1, v2):
+        '''Removes the edge between v1 and v2'''
+        pass
+
+    @abc.abstractmethod
+    def add_vertex(self):
+        '''Adds an isolated vertex and returns its id, which is the old num_vertices'''
+        pass
+
+    def add_vertices(self, count):
+        '''Adds count isolated vertices and returns the range of their ids'''
+        first = self.num_vertices
+        self._check_count(count)
+        for _ in range(count):
+            self.add_vertex()
+        return range(first, first+count)
+
+    @abc.abstractmethod
+    def remove_vertex(self, v):
+        '''Removes v and its edges, the vertices numbered above v move down by one'''
+        pass
+
+    def has_edge(self, v1, v2):
+        '''Returns True when there is an edge from v1 to v2'''
+        return v2 in self.get_adjacent_vertices(v1)
+
+    def update_weight(self, v1, v2, weight):
+        '''Changes the weight of the existing edge between v1 and v2'''
+        if not self.has_edge(v1, v2):
+            raise ValueError(f"No edge between v1: {v1} and v2: {v2}")
+        self.add_edge(v1, v2, weight)
+
+    def neighbor_scan_cost(self):
+        '''Returns the number of entries a get_adjacent_vertices call reads besides the neighbors it returns, searches
+        that pause after a given amount of work count it for every lookup'''
+        return 0
+
+    def subscribe(self, listener):
+        '''Calls listener(event, *args) after every mutation of the graph'''
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def snapshot(self):
+        '''Returns a read only view of the graph as it is now, storage is shared until this graph is written to'''
+        clone = copy.copy(self)
+        clone._read_only = True
+        clone._listeners = []
+        self._shared = True
+        return clone
+
+    def cheap_snapshots(self):
+        '''Returns True when snapshot() and the first write after it copy at most O(num_vertices), rather than all
+        the edges of the graph'''
+        return True
+
+    def _before_write(self):
+        '''Called before every mutation, gives this graph its own storage if a snapshot still shares it'''
+        if self._read_only:
+            raise ValueError("Graph snapshots are read only")
+        if self._shared:
+            self._detach()
+            self._shared = False
+
+    def _detach(self):
+        '''Stops sharing storage with snapshots, copying as little as possible'''
+        pass
+
+    def _changed(self, event, *args):
+        '''Bumps the version and notifies the listeners, events are ("add_edge", v1, v2, weight),
+        ("add_edges", src, dst, weights), ("remove_edge", v1, v2), ("add_vertex", v),
+        ("add_vertices", first, count) and ("remove_vertex", v)'''
+        self.version += 1
+        for listener in self._listeners:
+            listener(event, *args)
+
+    def _check_count(self, count):
+        if count < 0:
+            raise ValueError(f"Cannot add {count} vertices")
+
+    def _check_vertex(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+
+    def _validate_edges(self, src, dst, weights=None):
+        '''Checks the bounds of all the edges at once and returns them as lists'''
+        src, dst = _as_list(src), _as_list(dst)
+        if len(src) != len(dst):
+            raise ValueError(
+                f"src has {len(src)} vertices but dst has {len(dst)} vertices")
+        if weights is None:
+            weights = [1]*len(src)
+        else:
+            weights = _as_list(weights)
+            if len(weights) != len(src):
+                raise ValueError(
+                    f"Expected {len(src)} weights, got {len(weights)}")
+        if len(src) > 0:
+            low, high = min(min(src), min(dst)), max(max(src), max(dst))
+            if low < 0 or high >= self.num_vertices:
+                raise ValueError(
+                    f"Vertices must lie between 0 and {self.num_vertices-1}, got {low if low < 0 else high}")
+        return src, dst, weights
+
     @abc.abstractmethod
     def get_adjacent_vertices(self, v):
         '''Gets a list of vertices adjacent to v'''
         pass
 
+    @abc.abstractmethod
+    def get_incoming_vertices(self, v):
+        '''Gets a list of vertices that have an edge to v'''
+        pass
+
     @abc.abstractmethod
     def get_indegree(self, v):
         '''Returns the indegree of v'''
@@ -43,3 +180,10 @@ class Graph(abc.ABC):
     def get_edge_weight(self, v1, v2):
         '''Return the weight of edge between v1 and v2 '''
         pass
+
+
+def _as_list(values):
+    # numpy arrays and array.array both convert to a list of python numbers in C
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
@@ -1,14 +1,26 @@
 from representations.adjacent_matrix import AdjacentMatrix
 from representations.adjacent_set import AdjacentSet
+from representations.csr import CSR
+from representations.numpy_matrix import NumpyMatrix
 import abc
 
 
 class GraphAlgorithms(abc.ABC):
-    def __init__(self, num_vertices, rep, matrix, directed):
+    def __init__(self, num_vertices, rep, matrix, directed, reverse_index=True):
         if rep == "AdjacentMatrix":
             self.prop = AdjacentMatrix(num_vertices, matrix, directed)
         elif rep == "AdjacentSet":
-            self.prop = AdjacentSet(num_vertices, directed)
+            self.prop = AdjacentSet(num_vertices, directed, reverse_index)
+        elif rep == "CompactSet":
+            self.prop = AdjacentSet(num_vertices, directed, reverse_index, compact=True)
+        elif rep == "CSR":
+            self.prop = CSR(num_vertices, directed)
+        elif rep == "NumpyMatrix":
+            self.prop = NumpyMatrix(num_vertices, matrix, directed)
+        elif rep == "SparseMatrix":
+            self.prop = NumpyMatrix(num_vertices, matrix, directed, sparse=True)
+        else:
+            raise ValueError(f"Unknown representation {rep}")
 
     @abc.abstractmethod
     def breadth_first_search(self, source):
@@ -20,6 +32,16 @@ class GraphAlgorithms(abc.ABC):
         '''Returns a list of visited vertices using dfs traversal'''
         pass
 
+    @abc.abstractmethod
+    def iter_bfs(self, source):
+        '''Yields the vertices visited by a bfs traversal one at a time'''
+        pass
+
+    @abc.abstractmethod
+    def iter_dfs(self, current):
+        '''Yields the vertices visited by a dfs traversal one at a time'''
+        pass
+
     @abc.abstractmethod
     def topological_sort(self):
         '''Returns a list of visited vertices satisfying all precedence relationships.'''
@@ -35,6 +57,11 @@ class GraphAlgorithms(abc.ABC):
         '''Returns the shortest path using djisktra's algorithm between source and destination for a weighted graph.'''
         pass
 
+    @abc.abstractmethod
+    def shortest_path_tree(self, source, weighted):
+        '''Returns a ShortestPathTree answering path and cost queries from source to every vertex.'''
+        pass
+
     @abc.abstractmethod
     def minimum_cost(self, source, destination):
         '''Returns an int that is the minimum cost b/w source and destination'''
@@ -0,0 +1,41 @@
+from array import array
+
+
+class DisjointSet(object):
+    '''Union find over the integers 0..size-1 stored in flat arrays, with path halving and union by rank.'''
+
+    def __init__(self, size):
+        self._parent = array('l', range(size))
+        self._rank = bytearray(size)
+        self.num_sets = size
+
+    def add(self):
+        '''Adds a new singleton set and returns its element, size-1 after the call'''
+        self._parent.append(len(self._parent))
+        self._rank.append(0)
+        self.num_sets += 1
+        return len(self._parent)-1
+
+    def find(self, x):
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        '''Merges the sets of x and y, returns False when they were already the same set'''
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        rank = self._rank
+        if rank[x] < rank[y]:
+            x, y = y, x
+        self._parent[y] = x
+        if rank[x] == rank[y]:
+            rank[x] += 1
+        self.num_sets -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
@@ -0,0 +1,123 @@
+class indexed_priority_dict(dict):
+    '''Drop in replacement for priority_dict backed by a binary heap that tracks the position of every key,
+    so changing a priority is an O(log n) sift instead of a full heap rebuild.'''
+
+    def __init__(self, *args, **kwargs):
+        super(indexed_priority_dict, self).__init__(*args, **kwargs)
+        self._priority = super(indexed_priority_dict, self).__getitem__
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = list(self.keys())
+        self._position = {k: i for i, k in enumerate(self._heap)}
+        for i in reversed(range(len(self._heap)//2)):
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        heap, position, priority = self._heap, self._position, self._priority
+        key = heap[i]
+        val = priority(key)
+        while i > 0:
+            parent = (i-1) >> 1
+            parent_key = heap[parent]
+            parent_val = priority(parent_key)
+            if val > parent_val or (val == parent_val and key > parent_key):
+                break
+            heap[i] = parent_key
+            position[parent_key] = i
+            i = parent
+        heap[i] = key
+        position[key] = i
+
+    def _sift_down(self, i):
+        heap, position, priority = self._heap, self._position, self._priority
+        size = len(heap)
+        key = heap[i]
+        val = priority(key)
+        while True:
+            child = 2*i+1
+            if child >= size:
+                break
+            child_key = heap[child]
+            child_val = priority(child_key)
+            if child+1 < size:
+                right_key = heap[child+1]
+                right_val = priority(right_key)
+                if right_val < child_val or (right_val == child_val and right_key < child_key):
+                    child, child_key, child_val = child+1, right_key, right_val
+            if child_val > val or (child_val == val and child_key > key):
+                break
+            heap[i] = child_key
+            position[child_key] = i
+            i = child
+        heap[i] = key
+        position[key] = i
+
+    def smallest(self):
+        return self._heap[0]
+
+    def pop_smallest(self):
+        key = self._heap[0]
+        del self[key]
+        return key
+
+    def decrease_key(self, key, val):
+        if val > self[key]:
+            raise ValueError(
+                f"New priority {val} is larger than the current priority {self[key]} of {key}")
+        self[key] = val
+
+    def __setitem__(self, key, val):
+        if key in self:
+            old = dict.__getitem__(self, key)
+            super(indexed_priority_dict, self).__setitem__(key, val)
+            if val < old:
+                self._sift_up(self._position[key])
+            else:
+                self._sift_down(self._position[key])
+        else:
+            super(indexed_priority_dict, self).__setitem__(key, val)
+            self._heap.append(key)
+            self._sift_up(len(self._heap)-1)
+
+    def __delitem__(self, key):
+        i = self._position.pop(key)
+        last = self._heap.pop()
+        super(indexed_priority_dict, self).__delitem__(key)
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._position[last] = i
+            self._sift_up(i)
+            self._sift_down(self._position[last])
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super(indexed_priority_dict, self).pop(key, *default)
+        val = dict.__getitem__(self, key)
+        del self[key]
+        return val
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = self._heap[0]
+        return key, self.pop(key)
+
+    def clear(self):
+        super(indexed_priority_dict, self).clear()
+        self._heap = []
+        self._position = {}
+
+    def setdefault(self, key, val):
+        if key not in self:
+            self[key] = val
+            return val
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        super(indexed_priority_dict, self).update(*args, **kwargs)
+        self._rebuild_heap()
+
+    def sorted_iter(self):
+        while self:
+            yield self.pop_smallest()
@@ -0,0 +1,78 @@
+from operator import itemgetter
+
+
+class LabelIndex(object):
+    '''Interns hashable external keys into the dense ids 0..len-1 in the order they are first seen. The reverse lookup
+    is a list indexed by id, and the bulk translations run through map and itemgetter instead of a python loop.'''
+
+    def __init__(self, labels=()):
+        self._ids = {}
+        self._labels = []
+        self.intern_many(labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __contains__(self, label):
+        return label in self._ids
+
+    def intern(self, label):
+        '''Returns the id of label, giving it the next id if it is new'''
+        v = self._ids.get(label)
+        if v is None:
+            v = self._ids[label] = len(self._labels)
+            self._labels.append(label)
+        return v
+
+    def intern_many(self, labels):
+        '''Returns the list of ids of labels, new labels get ids in the order they appear'''
+        ids, new = self._ids, []
+        setdefault = ids.setdefault
+        size = len(self._labels)
+        result = []
+        for label in labels:
+            v = setdefault(label, size)
+            if v == size:
+                new.append(label)
+                size += 1
+            result.append(v)
+        self._labels.extend(new)
+        return result
+
+    def id_of(self, label):
+        v = self._ids.get(label)
+        if v is None:
+            raise ValueError(f"Unknown vertex label {label!r}")
+        return v
+
+    def ids_of(self, labels):
+        labels = list(labels)
+        try:
+            return list(map(self._ids.__getitem__, labels))
+        except KeyError as error:
+            raise ValueError(f"Unknown vertex label {error.args[0]!r}") from None
+
+    def label_of(self, v):
+        if v >= len(self._labels) or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        return self._labels[v]
+
+    def labels_of(self, ids):
+        ids = list(ids)
+        if len(ids) == 0:
+            return []
+        if len(ids) == 1:
+            return [self._labels[ids[0]]]
+        return list(itemgetter(*ids)(self._labels))
+
+    def labels(self):
+        return list(self._labels)
+
+    def remove_id(self, v):
+        '''Forgets the label of v, every id above v moves one lower like the vertices of Graph.remove_vertex'''
+        label = self.label_of(v)
+        del self._ids[label]
+        del self._labels[v]
+        ids = self._ids
+        for u in range(v, len(self._labels)):
+            ids[self._labels[u]] = u
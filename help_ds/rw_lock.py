@@ -0,0 +1,62 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+
+class ReadWriteLock(object):
+    '''Many readers or a single writer. Waiting writers block new readers, nested locks on one thread never block.'''
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def reading(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0 and self._writer != threading.get_ident():
+            with self._condition:
+                while self._writer is not None or self._writers_waiting > 0:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.depth = depth+1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0 and self._writer != threading.get_ident():
+                with self._condition:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._condition.notify_all()
+
+    @contextmanager
+    def writing(self):
+        if self._writer == threading.get_ident():
+            yield
+            return
+        if getattr(self._local, "depth", 0) > 0:
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers > 0:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+
+def read_locked(method):
+    '''Runs the method while holding self.lock for reading'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.reading():
+            return method(self, *args, **kwargs)
+    return wrapper
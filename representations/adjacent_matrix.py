@@ -16,33 +16,147 @@ Usage: create an object of the AdjacentMatrix class and call it's methods on the
        graph=AdjacentMatrix(num_vertices)
             EXAMPLES:
             graph.add_edge(0,1,2) #This adds an edge of weight 2 between vertices 0 and 1.
+            graph.add_edges([0,1],[2,3],[4,1]) #This adds the edges 0-2 of weight 4 and 1-3 of weight 1 in one call.
+            graph.update_weight(0,1,3) #This changes the weight of the edge between 0 and 1 to 3.
+            graph.remove_edge(0,1) #This removes the edge between 0 and 1.
+            graph.add_vertex() #This adds vertex num_vertices and returns it, O(num_vertices) as every row grows.
+            graph.add_vertices(100) #This adds 100 vertices growing every row once and returns the range of their ids.
+            graph.remove_vertex(4) #This removes vertex 4 and its edges, vertices above 4 are renumbered one lower.
             graph.get_adjacent_vertices(0) #This returns a list of adjacent vertices to vertex 0.
             graph.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+            graph.get_incoming_vertices(0) #This returns a list of vertices with an edge to vertex 0.
             graph.get_indegree(0) #This returns the indegree of vertex 0.
             graph.get_outdegree(0) #This returns the outdegree of vertex 0. 
+            graph.snapshot() #This returns a read only copy, rows are copied only when graph writes to them.
             graph.display() #This returns the set of edges of the graph with its weights.
 
 
 '''
+from itertools import repeat
 from graph_interface.graph import Graph
 
 
 class AdjacentMatrix(Graph):
-    def __init__(self, num_vertices, matrix=[], directed=False):
+    def __init__(self, num_vertices, matrix=None, directed=False):
         super(AdjacentMatrix, self).__init__(num_vertices, directed)
         self._matrix = matrix
-        if len(self._matrix) == 0:
+        if self._matrix is None or len(self._matrix) == 0:
+            self._matrix = []
             for _ in range(self.num_vertices):
                 self._matrix.append([0]*self.num_vertices)
-        self._visited = [0]*self.num_vertices
-        self._visit_order = []
+        self._indegree = [0]*self.num_vertices
+        self._outdegree = [0]*self.num_vertices
+        for i in range(self.num_vertices):
+            for j in range(self.num_vertices):
+                if self._matrix[i][j] > 0:
+                    self._outdegree[i] += 1
+                    self._indegree[j] += 1
+        # rows this graph may write in place, None when no snapshot shares the matrix
+        self._owned_rows = None
 
     def add_edge(self, v1, v2, weight=1):
         if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
             raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        self._before_write()
+        self._set_weight(v1, v2, weight)
+        if self.directed == False and v1 != v2:
+            self._set_weight(v2, v1, weight)
+        self._changed("add_edge", v1, v2, weight)
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst, weights = self._validate_edges(src, dst, weights)
+        self._before_write()
+        set_weight = self._set_weight
+        for v1, v2, weight in zip(src, dst, weights):
+            set_weight(v1, v2, weight)
+            if self.directed == False and v1 != v2:
+                set_weight(v2, v1, weight)
+        self._changed("add_edges", src, dst, weights)
+
+    def remove_edge(self, v1, v2):
+        if not self.has_edge(v1, v2):
+            raise ValueError(f"No edge between v1: {v1} and v2: {v2}")
+        self._before_write()
+        self._set_weight(v1, v2, 0)
+        if self.directed == False and v1 != v2:
+            self._set_weight(v2, v1, 0)
+        self._changed("remove_edge", v1, v2)
+
+    def has_edge(self, v1, v2):
+        return self.get_edge_weight(v1, v2) > 0
+
+    def add_vertex(self):
+        self._before_write()
+        v = self.num_vertices
+        for u in range(v):
+            self._own_row(u)
+            self._matrix[u].append(0)
+        self._matrix.append([0]*(v+1))
+        if self._owned_rows is not None:
+            self._owned_rows.add(v)
+        self._indegree.append(0)
+        self._outdegree.append(0)
+        self.num_vertices += 1
+        self._changed("add_vertex", v)
+        return v
+
+    def add_vertices(self, count):
+        self._check_count(count)
+        first = self.num_vertices
+        if count == 0:
+            return range(first, first)
+        self._before_write()
+        for u in range(first):
+            self._own_row(u)
+            self._matrix[u].extend(repeat(0, count))
+        n = first+count
+        self._matrix.extend([0]*n for _ in range(count))
+        if self._owned_rows is not None:
+            self._owned_rows.update(range(first, n))
+        self._indegree.extend(repeat(0, count))
+        self._outdegree.extend(repeat(0, count))
+        self.num_vertices = n
+        self._changed("add_vertices", first, count)
+        return range(first, n)
+
+    def remove_vertex(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._before_write()
+        for u in self.get_adjacent_vertices(v):
+            self._indegree[u] -= 1
+        for u in self.get_incoming_vertices(v):
+            self._outdegree[u] -= 1
+        # new rows without column v, so rows shared with snapshots are never changed in place
+        self._matrix = [row[:v]+row[v+1:self.num_vertices]
+                        for u, row in enumerate(self._matrix) if u != v]
+        self._owned_rows = None
+        del self._indegree[v]
+        del self._outdegree[v]
+        self.num_vertices -= 1
+        self._changed("remove_vertex", v)
+
+    def _detach(self):
+        self._matrix = list(self._matrix)
+        self._indegree = list(self._indegree)
+        self._outdegree = list(self._outdegree)
+        self._owned_rows = set()
+
+    def _own_row(self, v):
+        if self._owned_rows is not None and v not in self._owned_rows:
+            self._matrix[v] = list(self._matrix[v])
+            self._owned_rows.add(v)
+
+    def _set_weight(self, v1, v2, weight):
+        self._own_row(v1)
+        had_edge = self._matrix[v1][v2] > 0
         self._matrix[v1][v2] = weight
-        if self.directed == False:
-            self._matrix[v2][v1] = weight
+        if weight > 0 and not had_edge:
+            self._outdegree[v1] += 1
+            self._indegree[v2] += 1
+        elif had_edge and not weight > 0:
+            self._outdegree[v1] -= 1
+            self._indegree[v2] -= 1
 
     def get_adjacent_vertices(self, v):
         if v >= self.num_vertices or v < 0:
@@ -53,19 +167,28 @@ class AdjacentMatrix(Graph):
                 adjacent_vertices.append(i)
         return adjacent_vertices
 
-    def get_indegree(self, v):
+    def neighbor_scan_cost(self):
+        # every lookup scans a whole row
+        return self.num_vertices
+
+    def get_incoming_vertices(self, v):
         if v >= self.num_vertices or v < 0:
             raise ValueError(f"Cannot access vertex {v}")
-        indegree = 0
+        incoming_vertices = []
         for i in range(self.num_vertices):
             if self._matrix[i][v] > 0:
-                indegree += 1
-        return indegree
+                incoming_vertices.append(i)
+        return incoming_vertices
+
+    def get_indegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        return self._indegree[v]
 
     def get_outdegree(self, v):
         if v >= self.num_vertices or v < 0:
             raise ValueError(f"Cannot access vertes {v}")
-        return len(self.get_adjacent_vertices(v))
+        return self._outdegree[v]
 
     def get_edge_weight(self, v1, v2):
         if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
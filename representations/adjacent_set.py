@@ -14,54 +14,266 @@ Usage: create an object of the AdjacentSet class and call it's methods on the ob
 
         1.Initialization:
            graph=AdjacentSet(no_of_vertices,directed)
+           graph=AdjacentSet(no_of_vertices,directed,reverse_index=False) #Directed graphs keep the set of incoming vertices of every
+                                                                          #vertex unless reverse_index is False, get_incoming_vertices
+                                                                          #then scans every vertex.
+           graph=AdjacentSet(no_of_vertices,directed,compact=True) #Sorted typed arrays per vertex instead of a dict, the smallest
+                                                                    #on vertices of high degree, O(degree) inserts and O(log degree) lookups.
             EXAMPLES:
             graph.add_edge(0,1,2) #This adds an edge of weight 2 between vertices 0 and 1.
-            graph.get_adjacent_vertices(0) #This returns a list of adjacent vertices to vertex 0.
+            graph.add_edges([0,1],[2,3],[4,1]) #This adds the edges 0-2 of weight 4 and 1-3 of weight 1 in one call.
+            graph.update_weight(0,1,3) #This changes the weight of the edge between 0 and 1 to 3.
+            graph.remove_edge(0,1) #This removes the edge between 0 and 1.
+            graph.add_vertex() #This adds vertex num_vertices and returns it in amortized O(1).
+            graph.add_vertices(100) #This adds 100 vertices and returns the range of their ids.
+            graph.remove_vertex(4) #This removes vertex 4 and its edges, vertices above 4 are renumbered one lower.
+            graph.get_adjacent_vertices(0) #This returns the adjacent vertices of vertex 0 (an array in compact mode).
             graph.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+            graph.get_incoming_vertices(0) #This returns the vertices with an edge to vertex 0.
             graph.get_indegree(0) #This returns the indegree of vertex 0.
             graph.get_outdegree(0) #This returns the outdegree of vertex 0. 
+            graph.snapshot() #This returns a read only copy, vertices are copied only when graph writes to them.
             graph.display() #This returns the set of edges of the graph with its weights.
 
 '''
+from array import array
+from bisect import bisect_left
+from itertools import repeat
 from graph_interface.graph import Graph
 
 
 class Node(object):
+    # one dict maps every neighbor to its weight, its keys serve as the adjacent set
+    __slots__ = ("vertexId", "weight_list")
+
     def __init__(self, vertexId):
         self.vertexId = vertexId
-        self.adjacent_set = set()
         self.weight_list = {}
 
     def add_edge(self, v, weight):
         # if v == self.vertexId:
             # raise ValueError("vertex cannot be adjacent to itself")
-        self.adjacent_set.add(v)
+        is_new = v not in self.weight_list
         self.weight_list[v] = weight
+        return is_new
+
+    def remove_edge(self, v):
+        del self.weight_list[v]
+
+    def has_edge(self, v):
+        return v in self.weight_list
+
+    def items(self):
+        return self.weight_list.items()
+
+    def copy(self):
+        node = Node(self.vertexId)
+        node.weight_list = dict(self.weight_list)
+        return node
 
     def get_adjacent_vertices(self):
-        return self.adjacent_set
+        return self.weight_list.keys()
 
     def get_edge_weight(self, v):
-        if v in self.adjacent_set:
-            return self.weight_list[v]
+        return self.weight_list.get(v, 1)
+
+
+class CompactNode(object):
+    # neighbors in ascending order in a typed array, weights in a parallel array, found by binary search
+    __slots__ = ("vertexId", "neighbors", "weights")
+
+    def __init__(self, vertexId):
+        self.vertexId = vertexId
+        self.neighbors = array('l')
+        self.weights = array('l')
+
+    def add_edge(self, v, weight):
+        neighbors = self.neighbors
+        i = bisect_left(neighbors, v)
+        if not isinstance(weight, int) and self.weights.typecode == 'l':
+            self.weights = array('d', self.weights)
+        if i < len(neighbors) and neighbors[i] == v:
+            self.weights[i] = weight
+            return False
+        neighbors.insert(i, v)
+        self.weights.insert(i, weight)
+        return True
+
+    def remove_edge(self, v):
+        i = bisect_left(self.neighbors, v)
+        del self.neighbors[i]
+        del self.weights[i]
+
+    def has_edge(self, v):
+        neighbors = self.neighbors
+        i = bisect_left(neighbors, v)
+        return i < len(neighbors) and neighbors[i] == v
+
+    def items(self):
+        return zip(self.neighbors, self.weights)
+
+    def copy(self):
+        node = CompactNode(self.vertexId)
+        node.neighbors = array('l', self.neighbors)
+        node.weights = array(self.weights.typecode, self.weights)
+        return node
+
+    def get_adjacent_vertices(self):
+        return self.neighbors
+
+    def get_edge_weight(self, v):
+        neighbors = self.neighbors
+        i = bisect_left(neighbors, v)
+        if i < len(neighbors) and neighbors[i] == v:
+            return self.weights[i]
         return 1
 
 
 class AdjacentSet(Graph):
-    def __init__(self, num_vertices, directed=False):
+    def __init__(self, num_vertices, directed=False, reverse_index=True, compact=False):
         super(AdjacentSet, self).__init__(num_vertices, directed)
+        self._node_type = CompactNode if compact else Node
         self._vertex_list = []
-        self._visited = [0]*self.num_vertices
-        self._visit_order = []
+        self._indegree = [0]*self.num_vertices
+        self._outdegree = [0]*self.num_vertices
+        self._incoming = None
+        if reverse_index and self.directed:
+            self._incoming = [set() for _ in range(self.num_vertices)]
         for i in range(self.num_vertices):
-            self._vertex_list.append(Node(i))
+            self._vertex_list.append(self._node_type(i))
+        # vertices whose Node (and incoming set) this graph may write in place, None when no snapshot shares them
+        self._owned_vertices = None
 
     def add_edge(self, v1, v2, weight=1):
         if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
             raise ValueError(f"Vertex v1: {v1} and {v2} are out of bounds")
-        self._vertex_list[v1].add_edge(v2, weight)
-        if self.directed == False:
-            self._vertex_list[v2].add_edge(v1, weight)
+        self._before_write()
+        self._add_arc(v1, v2, weight)
+        if self.directed == False and v1 != v2:
+            self._add_arc(v2, v1, weight)
+        self._changed("add_edge", v1, v2, weight)
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst, weights = self._validate_edges(src, dst, weights)
+        self._before_write()
+        add_arc = self._add_arc
+        for v1, v2, weight in zip(src, dst, weights):
+            add_arc(v1, v2, weight)
+            if self.directed == False and v1 != v2:
+                add_arc(v2, v1, weight)
+        self._changed("add_edges", src, dst, weights)
+
+    def remove_edge(self, v1, v2):
+        if not self.has_edge(v1, v2):
+            raise ValueError(f"No edge between v1: {v1} and v2: {v2}")
+        self._before_write()
+        self._remove_arc(v1, v2)
+        if self.directed == False and v1 != v2:
+            self._remove_arc(v2, v1)
+        self._changed("remove_edge", v1, v2)
+
+    def has_edge(self, v1, v2):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and {v2} are out of bounds")
+        return self._vertex_list[v1].has_edge(v2)
+
+    def add_vertex(self):
+        self._before_write()
+        v = self.num_vertices
+        self._vertex_list.append(self._node_type(v))
+        self._indegree.append(0)
+        self._outdegree.append(0)
+        if self._incoming is not None:
+            self._incoming.append(set())
+        if self._owned_vertices is not None:
+            self._owned_vertices.add(v)
+        self.num_vertices += 1
+        self._changed("add_vertex", v)
+        return v
+
+    def add_vertices(self, count):
+        self._check_count(count)
+        first = self.num_vertices
+        if count == 0:
+            return range(first, first)
+        self._before_write()
+        n = first+count
+        self._vertex_list.extend(map(self._node_type, range(first, n)))
+        self._indegree.extend(repeat(0, count))
+        self._outdegree.extend(repeat(0, count))
+        if self._incoming is not None:
+            self._incoming.extend(set() for _ in range(count))
+        if self._owned_vertices is not None:
+            self._owned_vertices.update(range(first, n))
+        self.num_vertices = n
+        self._changed("add_vertices", first, count)
+        return range(first, n)
+
+    def remove_vertex(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._before_write()
+        for u in self._vertex_list[v].get_adjacent_vertices():
+            self._indegree[u] -= 1
+        for u in self.get_incoming_vertices(v):
+            self._outdegree[u] -= 1
+        del self._indegree[v]
+        del self._outdegree[v]
+        # every vertex above v is renumbered, so all the nodes are rebuilt instead of copied on write
+        vertex_list = []
+        for u, node in enumerate(self._vertex_list):
+            if u == v:
+                continue
+            new_node = self._node_type(len(vertex_list))
+            for x, weight in node.items():
+                if x != v:
+                    new_node.add_edge(x-1 if x > v else x, weight)
+            vertex_list.append(new_node)
+        self._vertex_list = vertex_list
+        self.num_vertices -= 1
+        if self._incoming is not None:
+            self._incoming = [set() for _ in range(self.num_vertices)]
+            for u, node in enumerate(self._vertex_list):
+                for x in node.get_adjacent_vertices():
+                    self._incoming[x].add(u)
+        self._owned_vertices = None
+        self._changed("remove_vertex", v)
+
+    def _detach(self):
+        self._vertex_list = list(self._vertex_list)
+        self._indegree = list(self._indegree)
+        self._outdegree = list(self._outdegree)
+        if self._incoming is not None:
+            self._incoming = list(self._incoming)
+        self._owned_vertices = set()
+
+    def _own(self, v):
+        self._vertex_list[v] = self._vertex_list[v].copy()
+        if self._incoming is not None:
+            self._incoming[v] = set(self._incoming[v])
+        self._owned_vertices.add(v)
+
+    def _add_arc(self, v1, v2, weight):
+        if self._owned_vertices is not None:
+            for v in (v1, v2):
+                if v not in self._owned_vertices:
+                    self._own(v)
+        if self._vertex_list[v1].add_edge(v2, weight):
+            self._outdegree[v1] += 1
+            self._indegree[v2] += 1
+            if self._incoming is not None:
+                self._incoming[v2].add(v1)
+
+    def _remove_arc(self, v1, v2):
+        if self._owned_vertices is not None:
+            for v in (v1, v2):
+                if v not in self._owned_vertices:
+                    self._own(v)
+        self._vertex_list[v1].remove_edge(v2)
+        self._outdegree[v1] -= 1
+        self._indegree[v2] -= 1
+        if self._incoming is not None:
+            self._incoming[v2].discard(v1)
 
     def get_adjacent_vertices(self, v):
         if v >= self.num_vertices or v < 0:
@@ -71,16 +283,25 @@ class AdjacentSet(Graph):
     def get_edge_weight(self, v1, v2):
         return self._vertex_list[v1].get_edge_weight(v2)
 
-    def get_indegree(self, v):
+    def get_incoming_vertices(self, v):
         if v >= self.num_vertices or v < 0:
             raise ValueError(f"Cannot access vertex {v}")
-        indegree = 0
+        if self.directed == False:
+            return self._vertex_list[v].get_adjacent_vertices()
+        if self._incoming is not None:
+            return self._incoming[v]
+        incoming_vertices = set()
         for i in range(self.num_vertices):
-            if v in self.get_adjacent_vertices(i):
-                indegree += 1
-        return indegree
+            if self._vertex_list[i].has_edge(v):
+                incoming_vertices.add(i)
+        return incoming_vertices
+
+    def get_indegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        return self._indegree[v]
 
     def get_outdegree(self, v):
         if v >= self.num_vertices or v < 0:
             raise ValueError(f"Cannot access vertex {v}")
-        return len(self.get_adjacent_vertices(v))
+        return self._outdegree[v]
@@ -0,0 +1,330 @@
+'''
+Description: Implements the methods present in the Graph Interface using a compressed sparse row (CSR) representation.
+             The graph is stored in three typed arrays: offsets (num_vertices+1 entries), neighbors and weights,
+             the neighbors of vertex v being neighbors[offsets[v]:offsets[v+1]] in ascending order.
+             Edges added or removed and vertices added are staged and merged into new arrays the next time the
+             graph is read, a merge copies the unchanged rows in bulk and rebuilds the changed ones, so mutations are
+             best applied in batches between reads. has_edge, remove_edge and update_weight look the edge up in the
+             staged changes and the merged arrays without merging. remove_vertex renumbers every edge and costs O(V+E).
+
+Usage: create an object of the CSR class and call it's methods on the object.
+       consider graph as shown below:
+
+       (0)******(1)*
+       *         *  *
+       *         *   (4)
+       *         *  *
+       (2)******(3)*
+
+        1.Initialization:
+           graph=CSR(no_of_vertices,directed)
+            EXAMPLES:
+            graph.add_edge(0,1,2) #This adds an edge of weight 2 between vertices 0 and 1.
+            graph.add_edges([0,1],[2,3],[4,1]) #This stages the edges 0-2 of weight 4 and 1-3 of weight 1 in one call.
+            graph.update_weight(0,1,3) #This changes the weight of the edge between 0 and 1 to 3.
+            graph.remove_edge(0,1) #This stages the removal of the edge between 0 and 1.
+            graph.add_vertex() #This adds vertex num_vertices and returns it in O(1).
+            graph.add_vertices(100) #This adds 100 vertices in O(1) and returns the range of their ids.
+            graph.remove_vertex(4) #This removes vertex 4 and its edges, vertices above 4 are renumbered one lower.
+            graph.get_adjacent_vertices(0) #This returns an array of adjacent vertices to vertex 0.
+            graph.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+            graph.get_incoming_vertices(0) #This returns an array of vertices with an edge to vertex 0.
+            graph.get_indegree(0) #This returns the indegree of vertex 0.
+            graph.get_outdegree(0) #This returns the outdegree of vertex 0.
+            graph.snapshot() #This returns a read only copy sharing the merged arrays with graph.
+
+'''
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from threading import Lock
+from graph_interface.graph import Graph
+
+
+class CSR(Graph):
+    def __init__(self, num_vertices, directed=False):
+        super(CSR, self).__init__(num_vertices, directed)
+        self._offsets = array('l', [0])*(self.num_vertices+1)
+        self._neighbors = array('l')
+        self._weights = array('l')
+        self._indegree = array('l', [0])*self.num_vertices
+        self._reverse = None
+        self._compact_lock = Lock()
+        self._pending_src = array('l')
+        self._pending_dst = array('l')
+        self._pending_weights = array('l')
+        # 1 where the staged change is a removal rather than an added edge
+        self._pending_removed = bytearray()
+        # latest staged state of every (v1, v2), 1 for a removal, indexed lazily up to _staged_count changes
+        self._staged = {}
+        self._staged_count = 0
+
+    def add_edge(self, v1, v2, weight=1):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        self._before_write()
+        if not isinstance(weight, int) and self._pending_weights.typecode == 'l':
+            self._pending_weights = array('d', self._pending_weights)
+        self._stage(v1, v2, weight, 0)
+        if self.directed == False and v1 != v2:
+            self._stage(v2, v1, weight, 0)
+        self._changed("add_edge", v1, v2, weight)
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst, weights = self._validate_edges(src, dst, weights)
+        self._before_write()
+        try:
+            typed_weights = array(self._pending_weights.typecode, weights)
+        except TypeError:
+            typed_weights = array('d', weights)
+        if typed_weights.typecode == 'd' and self._pending_weights.typecode == 'l':
+            self._pending_weights = array('d', self._pending_weights)
+        staged_src, staged_dst = src, dst
+        if self.directed == False:
+            # interleave both directions of every edge so a repeated edge keeps its last weight both ways
+            staged_src, staged_dst, typed_weights = _both_directions(src, dst, typed_weights)
+        self._pending_src.extend(staged_src)
+        self._pending_dst.extend(staged_dst)
+        self._pending_weights.extend(typed_weights)
+        self._pending_removed.extend(bytes(len(staged_src)))
+        self._changed("add_edges", src, dst, weights)
+
+    def remove_edge(self, v1, v2):
+        if not self.has_edge(v1, v2):
+            raise ValueError(f"No edge between v1: {v1} and v2: {v2}")
+        self._before_write()
+        self._stage(v1, v2, 0, 1)
+        if self.directed == False and v1 != v2:
+            self._stage(v2, v1, 0, 1)
+        self._changed("remove_edge", v1, v2)
+
+    def has_edge(self, v1, v2):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        with self._compact_lock:
+            if len(self._pending_src) > 0:
+                removed = self._staged_edges().get((v1, v2))
+                if removed is not None:
+                    return not removed
+            offsets, neighbors = self._offsets, self._neighbors
+        if v1+1 >= len(offsets):
+            # a vertex added since the last merge has no merged row
+            return False
+        start, end = offsets[v1], offsets[v1+1]
+        i = bisect_left(neighbors, v2, start, end)
+        return i < end and neighbors[i] == v2
+
+    def _staged_edges(self):
+        '''Indexes the changes staged since the last call, called with _compact_lock held'''
+        count = self._staged_count
+        if count < len(self._pending_src):
+            self._staged.update(zip(zip(self._pending_src[count:], self._pending_dst[count:]),
+                                    self._pending_removed[count:]))
+            self._staged_count = len(self._pending_src)
+        return self._staged
+
+    def add_vertex(self):
+        # the row of the new vertex is added by the next merge
+        self._before_write()
+        v = self.num_vertices
+        self.num_vertices += 1
+        self._changed("add_vertex", v)
+        return v
+
+    def add_vertices(self, count):
+        self._check_count(count)
+        first = self.num_vertices
+        if count == 0:
+            return range(first, first)
+        self._before_write()
+        self.num_vertices += count
+        self._changed("add_vertices", first, count)
+        return range(first, first+count)
+
+    def remove_vertex(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._before_write()
+        self._compact()
+        offsets, neighbors, weights = self._offsets, self._neighbors, self._weights
+        new_offsets = array('l', [0])
+        new_neighbors = array('l')
+        new_weights = array(weights.typecode)
+        indegree = array('l', [0])*(self.num_vertices-1)
+        for u in range(self.num_vertices):
+            if u == v:
+                continue
+            for i in range(offsets[u], offsets[u+1]):
+                x = neighbors[i]
+                if x != v:
+                    x = x-1 if x > v else x
+                    new_neighbors.append(x)
+                    new_weights.append(weights[i])
+                    indegree[x] += 1
+            new_offsets.append(len(new_neighbors))
+        self._offsets, self._neighbors, self._weights = new_offsets, new_neighbors, new_weights
+        self._indegree = indegree
+        self._reverse = None
+        self.num_vertices -= 1
+        self._changed("remove_vertex", v)
+
+    def _stage(self, v1, v2, weight, removed):
+        self._pending_src.append(v1)
+        self._pending_dst.append(v2)
+        self._pending_weights.append(weight)
+        self._pending_removed.append(removed)
+
+    def snapshot(self):
+        self._compact()
+        clone = super(CSR, self).snapshot()
+        clone._compact_lock = Lock()
+        return clone
+
+    def _detach(self):
+        # merged arrays are never written in place, only the staging arrays need to be new
+        self._clear_pending()
+
+    def _clear_pending(self):
+        self._pending_src = array('l')
+        self._pending_dst = array('l')
+        self._pending_weights = array(self._pending_weights.typecode)
+        self._pending_removed = bytearray()
+        self._staged = {}
+        self._staged_count = 0
+
+    def _compact(self):
+        '''Merges the staged changes and added vertices into the offset, neighbor and weight arrays'''
+        if len(self._pending_src) == 0 and len(self._offsets) == self.num_vertices+1:
+            return
+        # concurrent readers may all find staged changes, only the first one merges them
+        with self._compact_lock:
+            if len(self._pending_src) > 0 or len(self._offsets) != self.num_vertices+1:
+                self._merge_pending()
+
+    def _merge_pending(self):
+        n = self.num_vertices
+        merged = len(self._offsets)-1
+        offsets, neighbors = self._offsets, self._neighbors
+        typecode = 'd' if 'd' in (self._weights.typecode, self._pending_weights.typecode) else 'l'
+        weights = self._weights if self._weights.typecode == typecode else array(typecode, self._weights)
+
+        # the final state of every staged edge grouped by source, None for a removal
+        changes = {}
+        for v1, v2, weight, removed in zip(self._pending_src, self._pending_dst,
+                                          self._pending_weights, self._pending_removed):
+            changes.setdefault(v1, {})[v2] = None if removed else weight
+
+        new_offsets = array('l', [0])
+        new_neighbors = array('l')
+        new_weights = array(typecode)
+        indegree = array('l', self._indegree)
+        indegree.extend(repeat(0, n-merged))
+
+        def copy_rows(first, last):
+            # rows without changes are copied in bulk with their offsets shifted, rows past the merged ones are empty
+            upto = min(last, merged)
+            start, end = offsets[min(first, merged)], offsets[upto]
+            shift = len(new_neighbors)-start
+            new_neighbors.extend(neighbors[start:end])
+            new_weights.extend(weights[start:end])
+            if first < upto:
+                row_ends = offsets[first+1:upto+1]
+                new_offsets.extend(row_ends if shift == 0 else map(shift.__add__, row_ends))
+            if last > max(first, merged):
+                new_offsets.extend(repeat(len(new_neighbors), last-max(first, merged)))
+
+        first = 0
+        for v in sorted(changes):
+            copy_rows(first, v)
+            if v < merged:
+                row = dict(zip(neighbors[offsets[v]:offsets[v+1]], weights[offsets[v]:offsets[v+1]]))
+            else:
+                row = {}
+            for v2, weight in changes[v].items():
+                had_edge = v2 in row
+                if weight is None:
+                    row.pop(v2, None)
+                else:
+                    row[v2] = weight
+                indegree[v2] += (v2 in row)-had_edge
+            for v2 in sorted(row):
+                new_neighbors.append(v2)
+                new_weights.append(row[v2])
+            new_offsets.append(len(new_neighbors))
+            first = v+1
+        copy_rows(first, n)
+
+        self._offsets = new_offsets
+        self._neighbors = new_neighbors
+        self._weights = new_weights
+        self._indegree = indegree
+        self._reverse = None
+        self._clear_pending()
+
+    def get_adjacent_vertices(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._compact()
+        return self._neighbors[self._offsets[v]:self._offsets[v+1]]
+
+    def get_edge_weight(self, v1, v2):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        self._compact()
+        start, end = self._offsets[v1], self._offsets[v1+1]
+        i = bisect_left(self._neighbors, v2, start, end)
+        if i < end and self._neighbors[i] == v2:
+            return self._weights[i]
+        return 0
+
+    def _build_reverse(self):
+        '''Builds the transposed offset and neighbor arrays used by get_incoming_vertices'''
+        n = self.num_vertices
+        reverse_offsets = array('l', [0])*(n+1)
+        for v in range(n):
+            reverse_offsets[v+1] = reverse_offsets[v]+self._indegree[v]
+        reverse_neighbors = array('l', [0])*len(self._neighbors)
+        fill = array('l', reverse_offsets)
+        offsets, neighbors = self._offsets, self._neighbors
+        for u in range(n):
+            for i in range(offsets[u], offsets[u+1]):
+                v = neighbors[i]
+                reverse_neighbors[fill[v]] = u
+                fill[v] += 1
+        self._reverse = (reverse_offsets, reverse_neighbors)
+
+    def get_incoming_vertices(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._compact()
+        if self.directed == False:
+            return self._neighbors[self._offsets[v]:self._offsets[v+1]]
+        if self._reverse is None:
+            self._build_reverse()
+        reverse_offsets, reverse_neighbors = self._reverse
+        return reverse_neighbors[reverse_offsets[v]:reverse_offsets[v+1]]
+
+    def get_indegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._compact()
+        return self._indegree[v]
+
+    def get_outdegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._compact()
+        return self._offsets[v+1]-self._offsets[v]
+
+
+def _both_directions(src, dst, weights):
+    both_src, both_dst, both_weights = array('l'), array('l'), array(weights.typecode)
+    for v1, v2, weight in zip(src, dst, weights):
+        both_src.append(v1)
+        both_dst.append(v2)
+        both_weights.append(weight)
+        if v1 != v2:
+            both_src.append(v2)
+            both_dst.append(v1)
+            both_weights.append(weight)
+    return both_src, both_dst, both_weights
@@ -0,0 +1,75 @@
+'''
+Description: Read only CSR representation served straight from a memory mapped graph file (see storage/binary_format.py).
+             Nothing is parsed on load, the offset, neighbor, weight and indegree arrays are views into the mapping,
+             so opening a graph is O(1) and every process that maps the same file shares one copy in the page cache.
+
+Usage: create an object of the MappedCSR class and call it's methods on the object.
+
+        1.Initialization:
+           graph=MappedCSR("graph.bin")
+            EXAMPLES:
+            graph.get_adjacent_vertices(0) #This returns a memoryview of the vertices adjacent to vertex 0.
+            graph.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+            graph.get_indegree(0) #This returns the indegree of vertex 0.
+            graph.get_outdegree(0) #This returns the outdegree of vertex 0.
+            graph.close() #Releases the graph's own views and unmaps the file. Views returned by get_adjacent_vertices
+                          #keep the mapping alive until they are released or garbage collected.
+
+'''
+import mmap
+from storage.binary_format import DIRECTED, FLOAT_WEIGHTS, HEADER, read_header
+from representations.csr import CSR
+
+
+class MappedCSR(CSR):
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        flags, num_vertices, num_edges = read_header(self._mmap)
+        super(MappedCSR, self).__init__(0, bool(flags & DIRECTED))
+        self.num_vertices = num_vertices
+
+        buffer = memoryview(self._mmap)
+        start = HEADER.size
+        sections = []
+        for length, typecode in ((num_vertices+1, 'q'), (num_edges, 'q'),
+                                 (num_edges, 'd' if flags & FLOAT_WEIGHTS else 'q'),
+                                 (num_vertices, 'q')):
+            sections.append(buffer[start:start+8*length].cast(typecode))
+            start += 8*length
+        buffer.release()
+        self._offsets, self._neighbors, self._weights, self._indegree = sections
+
+    def add_edge(self, v1, v2, weight=1):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def add_edges(self, src, dst, weights=None):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def remove_edge(self, v1, v2):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def add_vertex(self):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def add_vertices(self, count):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def remove_vertex(self, v):
+        raise ValueError(f"Graph mapped from {self.path} is read only")
+
+    def snapshot(self):
+        return self
+
+    def close(self):
+        if self._mmap is None:
+            return
+        for view in (self._offsets, self._neighbors, self._weights, self._indegree):
+            view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # neighbor views handed out earlier still point into the mapping, it is unmapped once they are gone
+            pass
+        self._mmap = None
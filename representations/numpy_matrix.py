@@ -0,0 +1,285 @@
+'''
+Description: Implements the methods present in the Graph Interface using a NumPy adjacency matrix, or a scipy.sparse
+             one with sparse=True. Like AdjacentMatrix an entry greater than 0 is an edge. Neighbor, degree and bulk
+             edge operations are vectorized, and the class exposes whole matrix algorithms: bfs levels computed one
+             frontier at a time, reachability and degree vectors. In sparse mode every frontier is expanded with a
+             single sparse matrix-vector product.
+             NumPy (and SciPy for sparse=True) are optional dependencies of the library, they are only needed
+             when this representation is created.
+
+Usage: create an object of the NumpyMatrix class and call it's methods on the object.
+
+        1.Initialization:
+           graph=NumpyMatrix(num_vertices) #Dense numpy matrix.
+           graph=NumpyMatrix(num_vertices,matrix,directed) #matrix is a list of lists or an array of weights.
+           graph=NumpyMatrix(num_vertices,sparse=True) #scipy.sparse matrix, for large sparse graphs.
+            EXAMPLES:
+            graph.add_edge(0,1,2) #This adds an edge of weight 2 between vertices 0 and 1.
+            graph.add_edges(src,dst,weights) #Adds a batch of edges with vectorized writes.
+            graph.update_weight(0,1,3) #This changes the weight of the edge between 0 and 1 to 3.
+            graph.remove_edge(0,1) #This removes the edge between 0 and 1.
+            graph.add_vertex() #This adds vertex num_vertices and returns it, O(num_vertices) amortized as the dense matrix
+                               #keeps spare room and grows by half when it is full, using up to 2.25 times its size.
+            graph.add_vertices(100) #This adds 100 vertices at once and returns the range of their ids.
+            graph.remove_vertex(4) #This removes vertex 4 and its edges, vertices above 4 are renumbered one lower.
+            graph.get_adjacent_vertices(0) #This returns a list of adjacent vertices to vertex 0.
+            graph.get_edge_weight(0,1) #This returns the weight of the edge between 0 and 1.
+            graph.get_indegree(0) #This returns the indegree of vertex 0.
+            graph.get_outdegree(0) #This returns the outdegree of vertex 0.
+            graph.degree_vectors() #Returns the (indegree, outdegree) arrays of all vertices.
+            graph.bfs_levels(0) #Returns an array of bfs levels from vertex 0, -1 for unreachable vertices.
+            graph.reachability(0) #Returns a boolean array, True for vertices reachable from vertex 0.
+            graph.snapshot() #This returns a read only copy, the matrix is copied on the next write to graph.
+
+'''
+from graph_interface.graph import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyMatrix(Graph):
+    def __init__(self, num_vertices, matrix=None, directed=False, sparse=False):
+        if np is None:
+            raise ImportError("NumpyMatrix requires numpy")
+        super(NumpyMatrix, self).__init__(num_vertices, directed)
+        self.sparse = sparse
+        if sparse:
+            try:
+                from scipy import sparse as sp
+            except ImportError:
+                raise ImportError("NumpyMatrix with sparse=True requires scipy")
+            if matrix is None or len(matrix) == 0:
+                self._matrix = sp.lil_matrix(
+                    (self.num_vertices, self.num_vertices), dtype=np.int64)
+            else:
+                self._matrix = sp.lil_matrix(matrix)
+        elif matrix is None or len(matrix) == 0:
+            self._matrix = np.zeros(
+                (self.num_vertices, self.num_vertices), dtype=np.int64)
+        else:
+            self._matrix = np.array(matrix)
+        if self._matrix.shape != (self.num_vertices, self.num_vertices):
+            raise ValueError(
+                f"Expected a {self.num_vertices}x{self.num_vertices} matrix, got {self._matrix.shape}")
+        self._read_cache = (None, None)
+        # (backing array, view) pairs with room for more vertices, see _grow_array
+        self._matrix_spare = self._indegree_spare = self._outdegree_spare = None
+        self._count_degrees()
+
+    def _count_degrees(self):
+        adjacency = self._adjacency()
+        self._outdegree = np.asarray(adjacency.sum(axis=1)).ravel()
+        self._indegree = np.asarray(adjacency.sum(axis=0)).ravel()
+
+    def _read_matrix(self):
+        '''The matrix in a form fast to read, a csr matrix in sparse mode, rebuilt after writes'''
+        if not self.sparse:
+            return self._matrix
+        version, matrix = self._read_cache
+        if version != self.version or matrix is None:
+            matrix = self._matrix.tocsr()
+            self._read_cache = (self.version, matrix)
+        return matrix
+
+    def _adjacency(self):
+        '''Boolean matrix with True where there is an edge'''
+        return self._read_matrix() > 0
+
+    def _upcast(self, weight):
+        if not isinstance(weight, (int, np.integer)) and np.issubdtype(self._matrix.dtype, np.integer):
+            self._matrix = self._matrix.astype(np.float64)
+
+    def add_edge(self, v1, v2, weight=1):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        self._before_write()
+        self._upcast(weight)
+        self._set_weight(v1, v2, weight)
+        if self.directed == False and v1 != v2:
+            self._set_weight(v2, v1, weight)
+        self._changed("add_edge", v1, v2, weight)
+
+    def remove_edge(self, v1, v2):
+        if not self.has_edge(v1, v2):
+            raise ValueError(f"No edge between v1: {v1} and v2: {v2}")
+        self._before_write()
+        self._set_weight(v1, v2, 0)
+        if self.directed == False and v1 != v2:
+            self._set_weight(v2, v1, 0)
+        self._changed("remove_edge", v1, v2)
+
+    def has_edge(self, v1, v2):
+        return self.get_edge_weight(v1, v2) > 0
+
+    def add_vertex(self):
+        self._before_write()
+        v = self.num_vertices
+        self._grow(v+1)
+        self.num_vertices += 1
+        self._changed("add_vertex", v)
+        return v
+
+    def add_vertices(self, count):
+        self._check_count(count)
+        first = self.num_vertices
+        if count == 0:
+            return range(first, first)
+        self._before_write()
+        n = first+count
+        self._grow(n)
+        self.num_vertices = n
+        self._changed("add_vertices", first, count)
+        return range(first, n)
+
+    def _grow(self, n):
+        '''Makes the matrix and the degree arrays n vertices large, called after _before_write so they are not shared'''
+        if self.sparse:
+            # lil_matrix appends the new rows in place
+            self._matrix.resize((n, n))
+        else:
+            self._matrix, self._matrix_spare = _grow_array(self._matrix, self._matrix_spare, n)
+        self._indegree, self._indegree_spare = _grow_array(self._indegree, self._indegree_spare, n)
+        self._outdegree, self._outdegree_spare = _grow_array(self._outdegree, self._outdegree_spare, n)
+
+    def remove_vertex(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        self._before_write()
+        if self.sparse:
+            keep = np.flatnonzero(np.arange(self.num_vertices) != v)
+            self._matrix = self._read_matrix()[keep][:, keep].tolil()
+        else:
+            self._matrix = np.delete(np.delete(self._matrix, v, axis=0), v, axis=1)
+        self.num_vertices -= 1
+        self._changed("remove_vertex", v)
+        self._count_degrees()
+
+    def cheap_snapshots(self):
+        # _detach copies the whole matrix
+        return False
+
+    def _detach(self):
+        # a numpy matrix cannot share rows, the first write after a snapshot copies the whole matrix
+        self._matrix = self._matrix.copy()
+        self._indegree = self._indegree.copy()
+        self._outdegree = self._outdegree.copy()
+
+    def _set_weight(self, v1, v2, weight):
+        had_edge = self._matrix[v1, v2] > 0
+        self._matrix[v1, v2] = weight
+        if weight > 0 and not had_edge:
+            self._outdegree[v1] += 1
+            self._indegree[v2] += 1
+        elif had_edge and not weight > 0:
+            self._outdegree[v1] -= 1
+            self._indegree[v2] -= 1
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+        if src.shape != dst.shape:
+            raise ValueError(
+                f"src has {len(src)} vertices but dst has {len(dst)} vertices")
+        weights = np.ones(len(src), dtype=np.int64) if weights is None else np.asarray(weights)
+        if len(weights) != len(src):
+            raise ValueError(f"Expected {len(src)} weights, got {len(weights)}")
+        if len(src) == 0:
+            return
+        low, high = min(src.min(), dst.min()), max(src.max(), dst.max())
+        if low < 0 or high >= self.num_vertices:
+            raise ValueError(
+                f"Vertices must lie between 0 and {self.num_vertices-1}, got {low if low < 0 else high}")
+        self._before_write()
+        if not np.issubdtype(weights.dtype, np.integer):
+            self._upcast(1.5)
+        both_src, both_dst, both_weights = src, dst, weights
+        if self.directed == False:
+            # interleave both directions of every edge so a repeated edge keeps its last weight both ways
+            both_src = np.column_stack((src, dst)).ravel()
+            both_dst = np.column_stack((dst, src)).ravel()
+            both_weights = np.repeat(weights, 2)
+        self._matrix[both_src, both_dst] = both_weights
+        self._changed("add_edges", src.tolist(), dst.tolist(), weights.tolist())
+        self._count_degrees()
+
+    def get_adjacent_vertices(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        if self.sparse:
+            matrix = self._read_matrix()
+            start, end = matrix.indptr[v], matrix.indptr[v+1]
+            return matrix.indices[start:end][matrix.data[start:end] > 0].tolist()
+        return np.flatnonzero(self._matrix[v] > 0).tolist()
+
+    def neighbor_scan_cost(self):
+        # a dense lookup scans a whole row, a sparse one only the stored entries of the row
+        return 0 if self.sparse else self.num_vertices
+
+    def get_incoming_vertices(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        column = self._read_matrix()[:, v]
+        if self.sparse:
+            column = column.toarray().ravel()
+        return np.flatnonzero(column > 0).tolist()
+
+    def get_indegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        return int(self._indegree[v])
+
+    def get_outdegree(self, v):
+        if v >= self.num_vertices or v < 0:
+            raise ValueError(f"Cannot access vertex {v}")
+        return int(self._outdegree[v])
+
+    def get_edge_weight(self, v1, v2):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError(f"Vertex v1: {v1} and v2: {v2} are out of bounds")
+        return self._read_matrix()[v1, v2].item()
+
+    def degree_vectors(self):
+        return self._indegree.copy(), self._outdegree.copy()
+
+    def bfs_levels(self, source):
+        if source >= self.num_vertices or source < 0:
+            raise ValueError(f"Cannot access vertex {source}")
+        levels = np.full(self.num_vertices, -1, dtype=np.int64)
+        levels[source] = 0
+        frontier = np.zeros(self.num_vertices, dtype=bool)
+        frontier[source] = True
+        if self.sparse:
+            # adjacency_t @ frontier counts, for every vertex, the edges reaching it from the frontier
+            adjacency_t = self._adjacency().T.astype(np.int32).tocsr()
+        level = 0
+        while True:
+            if self.sparse:
+                reached = adjacency_t @ frontier.astype(np.int32) > 0
+            else:
+                reached = (self._matrix[frontier] > 0).any(axis=0)
+            reached &= levels < 0
+            if not reached.any():
+                return levels
+            level += 1
+            levels[reached] = level
+            frontier = reached
+
+    def reachability(self, source):
+        return self.bfs_levels(source) >= 0
+
+
+def _grow_array(current, spare, n):
+    '''Returns current grown to n along every axis and zero filled, as a view of a backing array with spare room,
+    and the (backing array, view) pair to pass back on the next call. The backing array grows by half when full, so
+    adding vertices one at a time copies every entry a constant number of times on average.'''
+    if spare is not None and spare[1] is current and spare[0].shape[0] >= n:
+        storage = spare[0]
+    else:
+        # current was replaced since the last call (a write after a snapshot, a removal...) or the room is used up
+        capacity = max(n, current.shape[0]+current.shape[0]//2)
+        storage = np.zeros((capacity,)*current.ndim, dtype=current.dtype)
+        storage[tuple(slice(0, size) for size in current.shape)] = current
+    view = storage[(slice(0, n),)*current.ndim]
+    return view, (storage, view)
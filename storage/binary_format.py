@@ -0,0 +1,82 @@
+'''
+Description: Versioned binary graph file that can be memory mapped and queried without parsing.
+
+File layout (little endian, every section 8 byte aligned):
+       header     magic b"GDSLCSR\0", version (uint32), flags (uint32), num_vertices (int64), num_edges (int64)
+       offsets    int64[num_vertices+1]  neighbors of v are neighbors[offsets[v]:offsets[v+1]], ascending
+       neighbors  int64[num_edges]
+       weights    int64[num_edges], or float64 when the FLOAT_WEIGHTS flag is set
+       indegree   int64[num_vertices]
+
+       An undirected edge is stored once in each direction, like in the CSR representation.
+
+Usage: save_graph(graph.prop, "graph.bin") #Works with any representation.
+       prop = load_graph("graph.bin") #Returns a read only MappedCSR serving queries from the mapped file.
+
+'''
+import struct
+from array import array
+from representations.csr import CSR
+
+MAGIC = b"GDSLCSR\0"
+VERSION = 1
+DIRECTED = 1
+FLOAT_WEIGHTS = 2
+HEADER = struct.Struct("<8sIIqq")
+
+
+def save_graph(prop, path):
+    if isinstance(prop, CSR):
+        prop._compact()
+        offsets, neighbors, weights = prop._offsets, prop._neighbors, prop._weights
+        indegree = prop._indegree
+    else:
+        offsets, neighbors, weights = _to_csr_arrays(prop)
+        indegree = array('q', (prop.get_indegree(v)
+                               for v in range(prop.num_vertices)))
+    flags = DIRECTED if prop.directed else 0
+    if weights.typecode == 'd':
+        flags |= FLOAT_WEIGHTS
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags,
+                               prop.num_vertices, len(neighbors)))
+        _as_int64(offsets).tofile(file)
+        _as_int64(neighbors).tofile(file)
+        (weights if weights.typecode == 'd' else _as_int64(weights)).tofile(file)
+        _as_int64(indegree).tofile(file)
+
+
+def load_graph(path):
+    from representations.mapped_csr import MappedCSR
+    return MappedCSR(path)
+
+
+def read_header(buffer):
+    magic, version, flags, num_vertices, num_edges = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a graph file")
+    if version != VERSION:
+        raise ValueError(
+            f"Unsupported graph file version {version}, expected {VERSION}")
+    return flags, num_vertices, num_edges
+
+
+def _to_csr_arrays(prop):
+    offsets = array('q', [0])
+    neighbors = array('q')
+    weights = array('l')
+    for v in range(prop.num_vertices):
+        for u in sorted(prop.get_adjacent_vertices(v)):
+            weight = prop.get_edge_weight(v, u)
+            if not isinstance(weight, int) and weights.typecode == 'l':
+                weights = array('d', weights)
+            neighbors.append(u)
+            weights.append(weight)
+        offsets.append(len(neighbors))
+    return offsets, neighbors, weights
+
+
+def _as_int64(values):
+    if values.typecode == 'q':
+        return values
+    return array('q', values)
@@ -0,0 +1,63 @@
+'''
+Description: Reads edge list files into typed arrays that can be handed to add_edges in one call.
+
+Usage: every non empty line of the file holds one edge "v1 v2" or "v1 v2 weight", lines starting with the comment
+       character are skipped. Columns are separated by whitespace unless a delimiter such as "," is given.
+
+       src, dst, weights = read_edge_list("edges.txt") #weights is None when the file has only two columns
+       graph.prop.add_edges(src, dst, weights)
+
+       The whole file is read at once, see storage/streaming.py to read large files in chunks.
+
+'''
+from array import array
+from itertools import chain
+
+
+def read_edge_list(path, delimiter=None, comment="#"):
+    with open(path, "r") as file:
+        text = file.read()
+    if comment and comment in text:
+        text = "".join(line for line in text.splitlines(True)
+                       if not line.lstrip().startswith(comment))
+    if delimiter is not None:
+        text = text.replace(delimiter, " ")
+
+    tokens, columns = _split_edges(text.splitlines(), None, path)
+    if columns is None:
+        return array('l'), array('l'), None
+    return _parse_tokens(tokens, columns, path)
+
+
+def _split_edges(lines, columns, path):
+    '''Returns the tokens of the non empty lines and their column count, which is taken from the first line when
+    columns is None. Every line must have the same number of columns.'''
+    rows = [row for row in map(str.split, lines) if row]
+    if not rows:
+        return [], columns
+    if columns is None:
+        columns = len(rows[0])
+        if columns not in (2, 3):
+            raise ValueError(
+                f"Expected 2 or 3 columns per edge, got {columns}")
+    if any(len(row) != columns for row in rows):
+        row = next(row for row in rows if len(row) != columns)
+        raise ValueError(
+            f"Every edge in {path} must have {columns} columns, got {len(row)} in {' '.join(row)!r}")
+    return list(chain.from_iterable(rows)), columns
+
+
+def _parse_tokens(tokens, columns, path):
+    '''Turns the whitespace separated tokens of whole edges into src, dst and weights arrays'''
+    if len(tokens) % columns != 0:
+        raise ValueError(
+            f"Every edge in {path} must have {columns} columns")
+    src = array('l', map(int, tokens[0::columns]))
+    dst = array('l', map(int, tokens[1::columns]))
+    weights = None
+    if columns == 3:
+        try:
+            weights = array('l', map(int, tokens[2::columns]))
+        except ValueError:
+            weights = array('d', map(float, tokens[2::columns]))
+    return src, dst, weights
@@ -0,0 +1,325 @@
+'''
+Description: Streaming edge list input and output. The readers are generators yielding (src, dst, weights) chunks of
+             at most chunk_size edges, so a file of any size is read with bounded memory, and every chunk can be handed
+             straight to add_edges. build_csr_file goes further and writes the binary CSR file of storage/binary_format.py
+             out of core: edges are spilled to partition files by source vertex, then every partition is sorted on its
+             own and appended to the file, so only one partition has to fit in memory. Partitions are ranges of
+             vertices_per_partition source vertices, a partition holding the out edges of hub vertices is loaded
+             whole whatever max_buffered_edges is, so lower vertices_per_partition for graphs with heavy hubs.
+
+Usage: for src, dst, weights in iter_edge_list("edges.txt"): #"v1 v2 [weight]" lines, delimiter="," for CSV files.
+       for src, dst, weights in iter_binary_edge_list("edges.bin"): #Files written by EdgeListWriter(binary=True).
+       for src, dst, weights in iter_adjacency_list("set.txt", skip_lines=1): #"v u1 w1 u2 w2 ..." lines.
+       ingest(graph.prop, iter_edge_list("edges.txt")) #Adds every chunk with add_edges, returns the number of edges.
+       num_vertices, num_edges = build_csr_file(iter_edge_list("edges.txt"), "graph.bin") #Then Graph.load("graph.bin").
+
+       with EdgeListWriter("edges.txt", delimiter=",") as writer: #Buffered writer, binary=True for the binary format.
+           writer.write_edge(0, 1, 2)
+           writer.write_edges(src, dst, weights)
+       with AdjacencyListWriter("set.txt", header="vertex & (adjacent vertices,weight)") as writer:
+           writer.write_vertex(0, [1, 8], [1, 1]) #Writes the line "0 1 1 8 1".
+       write_adjacency_list(graph.prop, "set.txt") #Writes one line per vertex of any representation.
+
+       The binary edge list is a header (magic b"GDSLEDG\0", version uint32, flags uint32) followed by one
+       (src int64, dst int64, weight int64 or float64 with the FLOAT_WEIGHTS flag) record per edge.
+
+'''
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from itertools import islice
+from storage.binary_format import DIRECTED, FLOAT_WEIGHTS, HEADER, MAGIC, VERSION
+from storage.edge_list import _parse_tokens, _split_edges
+
+EDGE_MAGIC = b"GDSLEDG\0"
+EDGE_VERSION = 1
+EDGE_HEADER = struct.Struct("<8sII")
+
+
+def iter_edge_list(path, chunk_size=65536, delimiter=None, comment="#"):
+    columns = None
+    with open(path, "r") as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            if comment:
+                lines = [line for line in lines if not line.lstrip().startswith(comment)]
+            if delimiter is not None:
+                lines = [line.replace(delimiter, " ") for line in lines]
+            tokens, columns = _split_edges(lines, columns, path)
+            if not tokens:
+                continue
+            yield _parse_tokens(tokens, columns, path)
+
+
+def iter_binary_edge_list(path, chunk_size=65536):
+    with open(path, "rb") as file:
+        magic, version, flags = EDGE_HEADER.unpack(file.read(EDGE_HEADER.size))
+        if magic != EDGE_MAGIC:
+            raise ValueError("Not a binary edge list")
+        if version != EDGE_VERSION:
+            raise ValueError(
+                f"Unsupported edge list version {version}, expected {EDGE_VERSION}")
+        while True:
+            records = array('q', file.read(24*chunk_size))
+            if not records:
+                return
+            weights = array('q', records[2::3])
+            if flags & FLOAT_WEIGHTS:
+                weights = array('d', weights.tobytes())
+            yield records[0::3], records[1::3], weights
+
+
+def iter_adjacency_list(path, chunk_size=65536, skip_lines=0):
+    '''Reads "v u1 w1 u2 w2 ..." lines, every line adds the edges from v to u1, u2... with their weights'''
+    with open(path, "r") as file:
+        for _ in islice(file, skip_lines):
+            pass
+        src, dst, weights = array('l'), array('l'), array('l')
+        for line in file:
+            tokens = line.split()
+            if not tokens:
+                continue
+            if len(tokens) % 2 == 0:
+                raise ValueError(
+                    f"Every line of {path} must be a vertex followed by (vertex, weight) pairs")
+            v = int(tokens[0])
+            src.extend([v]*(len(tokens)//2))
+            dst.extend(map(int, tokens[1::2]))
+            # the weights of a line are parsed before any is added, so a float after an int cannot leave them half added
+            try:
+                line_weights = list(map(int, tokens[2::2]))
+            except ValueError:
+                line_weights = list(map(float, tokens[2::2]))
+                if weights.typecode != 'd':
+                    weights = array('d', weights)
+            weights.extend(line_weights)
+            if len(src) >= chunk_size:
+                yield src, dst, weights
+                src, dst, weights = array('l'), array('l'), array('l')
+        if src:
+            yield src, dst, weights
+
+
+def ingest(prop, chunks):
+    num_edges = 0
+    for src, dst, weights in chunks:
+        prop.add_edges(src, dst, weights)
+        num_edges += len(src)
+    return num_edges
+
+
+class EdgeListWriter(object):
+    '''Buffered edge list writer, the file is opened once and written in blocks of buffer_size bytes'''
+
+    def __init__(self, path, delimiter=" ", binary=False, float_weights=False, buffer_size=1 << 20):
+        self.binary = binary
+        self.delimiter = delimiter
+        self.float_weights = float_weights
+        if binary:
+            self._file = open(path, "wb", buffering=buffer_size)
+            self._file.write(EDGE_HEADER.pack(EDGE_MAGIC, EDGE_VERSION, FLOAT_WEIGHTS if float_weights else 0))
+        else:
+            self._file = open(path, "w", buffering=buffer_size)
+
+    def write_edge(self, v1, v2, weight=None):
+        self.write_edges([v1], [v2], None if weight is None else [weight])
+
+    def write_edges(self, src, dst, weights=None):
+        if len(src) != len(dst) or (weights is not None and len(weights) != len(src)):
+            raise ValueError("src, dst and weights must have the same length")
+        if self.binary:
+            records = array('q', [0])*(3*len(src))
+            records[0::3] = array('q', src)
+            records[1::3] = array('q', dst)
+            if weights is None:
+                weights = [1.0 if self.float_weights else 1]*len(src)
+            typed_weights = array('d' if self.float_weights else 'q', weights)
+            records[2::3] = array('q', typed_weights.tobytes())
+            records.tofile(self._file)
+        elif weights is None:
+            delimiter = self.delimiter
+            self._file.writelines(f"{v1}{delimiter}{v2}\n" for v1, v2 in zip(src, dst))
+        else:
+            delimiter = self.delimiter
+            self._file.writelines(f"{v1}{delimiter}{v2}{delimiter}{weight}\n"
+                                  for v1, v2, weight in zip(src, dst, weights))
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AdjacencyListWriter(object):
+    '''Buffered writer of "v u1 w1 u2 w2 ..." lines, the format read by iter_adjacency_list'''
+
+    def __init__(self, path, header=None, buffer_size=1 << 20):
+        self._file = open(path, "w", buffering=buffer_size)
+        if header is not None:
+            self._file.write(f"{header}\n")
+
+    def write_vertex(self, v, neighbors, weights):
+        pairs = " ".join(f"{u} {weight}" for u, weight in zip(neighbors, weights))
+        self._file.write(f"{v} {pairs}\n" if pairs else f"{v}\n")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_adjacency_list(prop, path, header=None):
+    with AdjacencyListWriter(path, header) as writer:
+        for v in range(prop.num_vertices):
+            neighbors = prop.get_adjacent_vertices(v)
+            writer.write_vertex(v, neighbors, [prop.get_edge_weight(v, u) for u in neighbors])
+
+
+def build_csr_file(chunks, path, num_vertices=None, directed=False, vertices_per_partition=65536,
+                   max_buffered_edges=1 << 20, tmp_dir=None):
+    '''Writes the binary CSR file of the streamed edges without holding them all in memory, a repeated edge keeps
+    its last weight. Returns (num_vertices, num_edges), num_vertices defaults to the largest vertex+1.
+    max_buffered_edges bounds the edges buffered while spilling, the sort step holds the edges of one partition.'''
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        partitions = _Partitions(directory, vertices_per_partition, max_buffered_edges)
+        for src, dst, weights in chunks:
+            if weights is None:
+                weights = array('l', [1])*len(src)
+            if len(src) > 0:
+                low, high = min(min(src), min(dst)), max(max(src), max(dst))
+                if low < 0:
+                    raise ValueError(
+                        f"Vertices must not be negative, got {low}")
+                if num_vertices is not None and high >= num_vertices:
+                    raise ValueError(
+                        f"Vertices must lie between 0 and {num_vertices-1}, got {high}")
+            partitions.add(src, dst, weights, directed)
+        partitions.flush()
+        if num_vertices is None:
+            num_vertices = partitions.largest_vertex+1
+
+        offsets = array('q', [0])*(num_vertices+1)
+        indegree = array('q', [0])*num_vertices
+        typecode = 'd' if partitions.float_weights else 'q'
+        neighbors_path, weights_path = os.path.join(directory, "neighbors"), os.path.join(directory, "weights")
+        num_edges = 0
+        with open(neighbors_path, "wb") as neighbors_file, open(weights_path, "wb") as weights_file:
+            for index in range(partitions.count()):
+                src, dst, weights = partitions.load(index, typecode)
+                # two stable sorts order the positions by (src, dst) without a key tuple per edge, and the last of
+                # every repeated edge stays last
+                order = sorted(range(len(src)), key=dst.__getitem__)
+                order.sort(key=src.__getitem__)
+                row_neighbors, row_weights = array('q'), array(typecode)
+                for position, i in enumerate(order):
+                    if position+1 < len(order):
+                        j = order[position+1]
+                        if src[j] == src[i] and dst[j] == dst[i]:
+                            continue
+                    row_neighbors.append(dst[i])
+                    row_weights.append(weights[i])
+                    offsets[src[i]+1] += 1
+                    indegree[dst[i]] += 1
+                row_neighbors.tofile(neighbors_file)
+                row_weights.tofile(weights_file)
+                num_edges += len(row_neighbors)
+        for v in range(num_vertices):
+            offsets[v+1] += offsets[v]
+
+        flags = (DIRECTED if directed else 0) | (FLOAT_WEIGHTS if typecode == 'd' else 0)
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, flags, num_vertices, num_edges))
+            offsets.tofile(file)
+            for section in (neighbors_path, weights_path):
+                with open(section, "rb") as section_file:
+                    shutil.copyfileobj(section_file, file)
+            indegree.tofile(file)
+    return num_vertices, num_edges
+
+
+class _Partitions(object):
+    '''Edges bucketed by source vertex range, buffered in memory and appended to one file per partition'''
+
+    def __init__(self, directory, vertices_per_partition, max_buffered_edges):
+        self.directory = directory
+        self.vertices_per_partition = vertices_per_partition
+        self.max_buffered_edges = max_buffered_edges
+        self.largest_vertex = -1
+        self.float_weights = False
+        self._buffers = {}
+        self._buffered = 0
+        # (count, weight typecode) of every block appended to each partition file
+        self._blocks = {}
+
+    def add(self, src, dst, weights, directed):
+        if not isinstance(weights, array) or weights.typecode != 'd':
+            try:
+                weights = array('q', weights)
+            except TypeError:
+                weights = array('d', weights)
+        if weights.typecode == 'd':
+            self.float_weights = True
+        if len(src) > 0:
+            self.largest_vertex = max(self.largest_vertex, max(src), max(dst))
+        size, typecode = self.vertices_per_partition, weights.typecode
+        buffers = self._buffers
+        for v1, v2, weight in zip(src, dst, weights):
+            arcs = ((v1, v2), (v2, v1)) if not directed and v1 != v2 else ((v1, v2),)
+            for a, b in arcs:
+                buffer = buffers.get(a//size)
+                if buffer is None or buffer[2].typecode != typecode:
+                    if buffer is not None:
+                        self._write(a//size)
+                    buffer = buffers[a//size] = (array('q'), array('q'), array(typecode))
+                buffer[0].append(a)
+                buffer[1].append(b)
+                buffer[2].append(weight)
+                self._buffered += 1
+            if self._buffered >= self.max_buffered_edges:
+                self.flush()
+
+    def flush(self):
+        for index in list(self._buffers):
+            self._write(index)
+        self._buffered = 0
+
+    def _write(self, index):
+        src, dst, weights = self._buffers.pop(index)
+        with open(self._path(index), "ab") as file:
+            src.tofile(file)
+            dst.tofile(file)
+            weights.tofile(file)
+        self._blocks.setdefault(index, []).append((len(src), weights.typecode))
+        self._buffered -= len(src)
+
+    def count(self):
+        return (self.largest_vertex // self.vertices_per_partition)+1
+
+    def load(self, index, typecode):
+        src, dst, weights = array('q'), array('q'), array(typecode)
+        if index not in self._blocks:
+            return src, dst, weights
+        with open(self._path(index), "rb") as file:
+            for count, block_typecode in self._blocks[index]:
+                src.fromfile(file, count)
+                dst.fromfile(file, count)
+                block = array(block_typecode)
+                block.fromfile(file, count)
+                weights.extend(block if block_typecode == typecode else array(typecode, block))
+        os.remove(self._path(index))
+        return src, dst, weights
+
+    def _path(self, index):
+        return os.path.join(self.directory, f"partition_{index}")
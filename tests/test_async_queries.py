@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from algorithms.graph_algorithms import Graph
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR", "NumpyMatrix"]
+
+
+def grid(rep, side):
+    src, dst, weights = [], [], []
+    for v in range(side*side):
+        if v % side != side-1:
+            src.append(v), dst.append(v+1), weights.append(1+v % 3)
+        if v+side < side*side:
+            src.append(v), dst.append(v+side), weights.append(1+v % 5)
+    return Graph.from_edges(side*side, src, dst, weights, rep)
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_results_match_sync_methods(rep):
+    graph = grid(rep, 12)
+    pool = ThreadPoolExecutor(1)
+
+    async def main():
+        assert await graph.breadth_first_search_async(0, yield_every=3) == graph.breadth_first_search(0)
+        assert await graph.depth_first_search_async(0, yield_every=3) == graph.depth_first_search(0)
+        for target in (5, 77, 143):
+            assert await graph.shortest_path_weighted_async(0, target, yield_every=2) == \
+                graph.shortest_path_weighted(0, target)
+            assert await graph.minimum_cost_async(0, target, executor=pool) == graph.minimum_cost(0, target)
+            assert await graph.shortest_path_unweighted_async(0, target, snapshot=True) == \
+                graph.shortest_path_unweighted(0, target)
+        tree = await graph.shortest_path_tree_async(0, weighted=False, snapshot=False)
+        assert tree.distances() == graph.shortest_path_tree(0, weighted=False).distances()
+
+    asyncio.run(main())
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("executor", [None, "pool"])
+def test_timeout_stops_long_query(executor):
+    # every lookup of the matrix scans a 3000 entry row, which counts as work between pauses
+    n = 3000
+    graph = Graph.from_edges(n, range(n-1), range(1, n), None, "AdjacentMatrix")
+    pool = ThreadPoolExecutor(1) if executor else None
+
+    async def main():
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await graph.shortest_path_tree_async(0, timeout=0.01, executor=pool)
+        return time.perf_counter()-start
+
+    assert asyncio.run(main()) < 0.2
+    if pool is not None:
+        pool.shutdown()
+
+
+def test_timeout_covers_waiting_for_a_writer():
+    graph = Graph.from_edges(3, [0, 1], [1, 2], None, "AdjacentSet")
+    locked, release = threading.Event(), threading.Event()
+
+    def writer():
+        with graph.lock.writing():
+            locked.set()
+            release.wait(10)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    locked.wait(10)
+
+    async def main():
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await graph.minimum_cost_async(0, 2, timeout=0.1)
+        elapsed = time.perf_counter()-start
+        # the thread taking the snapshot still waits for the writer, asyncio.run waits for it on exit
+        release.set()
+        return elapsed
+
+    try:
+        assert asyncio.run(main()) < 1
+    finally:
+        release.set()
+        thread.join(10)
+
+
+def test_cancel_stops_query():
+    graph = grid("CSR", 150)
+    steps = []
+
+    async def main():
+        task = asyncio.create_task(graph.shortest_path_tree_async(0, yield_every=16))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # other tasks keep running while a query is paused
+        steps.append(1)
+
+    asyncio.run(main())
+    assert steps == [1]
+
+
+def test_snapshot_default_follows_representation():
+    async def query(graph):
+        await graph.minimum_cost_async(0, 5)
+
+    cheap = grid("AdjacentSet", 4)
+    asyncio.run(query(cheap))
+    assert cheap.prop._shared
+    costly = grid("NumpyMatrix", 4)
+    asyncio.run(query(costly))
+    assert not costly.prop._shared
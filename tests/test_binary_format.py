@@ -0,0 +1,42 @@
+import pytest
+from algorithms.graph_algorithms import Graph
+
+
+def edges_of(prop):
+    return {(v1, v2, prop.get_edge_weight(v1, v2))
+            for v1 in range(prop.num_vertices) for v2 in prop.get_adjacent_vertices(v1)}
+
+
+@pytest.mark.parametrize("rep", ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"])
+@pytest.mark.parametrize("directed", [False, True])
+def test_save_load_round_trip(tmp_path, rep, directed):
+    path = tmp_path/"graph.bin"
+    graph = Graph.from_edges(5, [0, 0, 1, 3], [1, 2, 3, 4], [2, 1.5, 5, 4], rep, directed)
+    graph.save(path)
+    with Graph.load(path) as loaded:
+        assert loaded.prop.num_vertices == 5
+        assert loaded.prop.directed == directed
+        assert edges_of(loaded.prop) == edges_of(graph.prop)
+        assert [loaded.prop.get_indegree(v) for v in range(5)] == [graph.prop.get_indegree(v) for v in range(5)]
+        assert loaded.shortest_path_weighted(0, 4) == graph.shortest_path_weighted(0, 4)
+        with pytest.raises(ValueError):
+            loaded.add_edge(2, 4)
+
+
+def test_close_with_live_neighbor_views(tmp_path):
+    path = tmp_path/"graph.bin"
+    Graph.from_edges(3, [0, 1], [1, 2], None, "CSR").save(path)
+    graph = Graph.load(path)
+    neighbors = graph.prop.get_adjacent_vertices(0)
+    graph.close()
+    graph.close()
+    assert list(neighbors) == [1]
+    with pytest.raises(ValueError):
+        graph.prop.get_adjacent_vertices(0)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path/"graph.bin"
+    path.write_bytes(b"not a graph file at all, just some bytes of text")
+    with pytest.raises(ValueError):
+        Graph.load(path)
@@ -0,0 +1,36 @@
+from algorithms.graph_algorithms import Graph
+
+
+def test_cache_serves_repeated_queries():
+    graph = Graph.from_edges(4, [0, 1, 2], [1, 2, 3], [1, 1, 1], "CSR")
+    graph.enable_cache()
+    assert graph.minimum_cost(0, 3) == 3
+    assert graph.minimum_cost(0, 3) == 3
+    stats = graph.cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_mutation_invalidates_cache():
+    graph = Graph.from_edges(4, [0, 1, 2], [1, 2, 3], [1, 1, 1], "AdjacentSet")
+    graph.enable_cache()
+    assert graph.shortest_path_weighted(0, 3) == [0, 1, 2, 3]
+    version = graph.prop.version
+    graph.add_edge(0, 3, 1)
+    assert graph.prop.version > version
+    assert graph.shortest_path_weighted(0, 3) == [0, 3]
+    assert graph.cache_stats()["invalidations"] == 1
+    graph.remove_edge(0, 3)
+    assert graph.minimum_cost(0, 3) == 3
+    graph.add_vertices(1)
+    assert graph.minimum_cost(0, 4) == 0
+    assert graph.cache_stats()["invalidations"] == 3
+
+
+def test_snapshot_gets_its_own_cache():
+    graph = Graph.from_edges(3, [0, 1], [1, 2], None, "AdjacentMatrix")
+    graph.enable_cache()
+    graph.minimum_cost(0, 2)
+    snapshot = graph.snapshot()
+    graph.add_edge(0, 2, 1)
+    assert snapshot.minimum_cost(0, 2) == 2
+    assert graph.minimum_cost(0, 2) == 1
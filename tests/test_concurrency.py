@@ -0,0 +1,122 @@
+import threading
+import time
+import pytest
+from algorithms.graph_algorithms import Graph
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"]
+
+
+def run_threads(targets, seconds=None):
+    errors = []
+
+    def guarded(target):
+        try:
+            target()
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(seconds)
+    assert not any(thread.is_alive() for thread in threads), "a thread did not finish"
+    if errors:
+        raise errors[0]
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_readers_see_whole_writes(rep):
+    # the writer grows the path 0-1-2-..., every reader must see a path 0..m that never shrinks
+    n = 200
+    graph = Graph(n, rep)
+    done = threading.Event()
+
+    def writer():
+        try:
+            for v in range(n-1):
+                graph.add_edge(v, v+1)
+                if v % 20 == 0:
+                    time.sleep(0.001)
+        finally:
+            done.set()
+
+    def reader():
+        seen = 1
+        while not done.is_set() or seen < n:
+            order = graph.breadth_first_search(0)
+            assert order == list(range(len(order)))
+            assert len(order) >= seen
+            seen = len(order)
+            last = seen-1
+            assert graph.minimum_cost(0, last) == last
+            assert graph.shortest_path_unweighted(0, last) == order
+
+    run_threads([writer]+[reader]*4, seconds=60)
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_bulk_writes_are_atomic(rep):
+    # every batch adds a star around a new center, a reader never sees a partial star
+    n, leaves = 60, 5
+    graph = Graph(n*(leaves+1), rep)
+    done = threading.Event()
+
+    def writer():
+        try:
+            for star in range(n):
+                center = star*(leaves+1)
+                graph.add_edges([center]*leaves, range(center+1, center+leaves+1))
+        finally:
+            done.set()
+
+    def reader():
+        while not done.is_set():
+            with graph.lock.reading():
+                degrees = [graph.prop.get_outdegree(star*(leaves+1)) for star in range(n)]
+            assert set(degrees) <= {0, leaves}
+            assert degrees == sorted(degrees, reverse=True)
+
+    run_threads([writer]+[reader]*3, seconds=60)
+
+
+def test_concurrent_readers_merge_csr_once():
+    n = 2000
+    graph = Graph(n, "CSR", directed=True)
+    graph.add_edges(range(n-1), range(1, n))
+    results = []
+
+    def reader():
+        results.append(graph.breadth_first_search(0))
+
+    run_threads([reader]*8, seconds=60)
+    assert all(result == list(range(n)) for result in results)
+
+
+def test_write_lock_waits_for_readers():
+    graph = Graph(3, "AdjacentSet")
+    entered, release = threading.Event(), threading.Event()
+    events = []
+
+    def reader():
+        with graph.lock.reading():
+            entered.set()
+            release.wait(10)
+            events.append("read")
+
+    def writer():
+        entered.wait(10)
+        graph.add_edge(0, 1)
+        events.append("write")
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    time.sleep(0.05)
+    assert events == []
+    release.set()
+    thread.join(10)
+    writer_thread.join(10)
+    assert events == ["read", "write"]
+    assert graph.prop.has_edge(1, 0)
@@ -0,0 +1,81 @@
+import random
+import pytest
+from algorithms.connectivity import ConnectivityIndex, connected_components, strongly_connected_components
+from algorithms.graph_algorithms import Graph
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"]
+
+
+def reachable(prop, source):
+    seen, stack = {source}, [source]
+    while stack:
+        for v in prop.get_adjacent_vertices(stack.pop()):
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return seen
+
+
+def same_partition(component, expected):
+    n = len(component)
+    return all((component[u] == component[v]) == expected(u, v) for u in range(n) for v in range(n))
+
+
+@pytest.mark.parametrize("rep", REPS)
+@pytest.mark.parametrize("seed", range(5))
+def test_components_match_reachability(rep, seed):
+    rng = random.Random(seed)
+    n = 12
+    graph = Graph(n, rep, directed=True)
+    graph.add_edges([rng.randrange(n) for _ in range(14)], [rng.randrange(n) for _ in range(14)])
+    reach = [reachable(graph.prop, v) for v in range(n)]
+    for strategy in ("tarjan", "kosaraju"):
+        component, count = strongly_connected_components(graph.prop, strategy)
+        assert count == len(set(component))
+        assert same_partition(component, lambda u, v: v in reach[u] and u in reach[v])
+    undirected = Graph(n, rep)
+    undirected.add_edges(*zip(*[(v1, v2) for v1 in range(n) for v2 in graph.prop.get_adjacent_vertices(v1)]))
+    weak, _ = connected_components(graph.prop)
+    assert weak == connected_components(undirected.prop)[0]
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_index_follows_undirected_mutations(rep):
+    graph = Graph(4, rep)
+    assert not graph.are_connected(0, 3)
+    graph.add_edge(0, 1)
+    graph.add_edges([1, 2], [2, 3])
+    assert graph.are_connected(0, 3)
+    v = graph.add_vertex()
+    first = graph.add_vertices(2)[0]
+    assert not graph.are_connected(0, v)
+    graph.add_edge(v, first)
+    assert graph.are_connected(first, v)
+    assert graph._connectivity.num_components() == 3
+    # removals cannot be undone in a union find, the index is rebuilt
+    graph.remove_edge(1, 2)
+    assert not graph.are_connected(0, 3)
+    graph.remove_vertex(0)
+    assert graph.are_connected(1, 2)
+    assert graph._connectivity.num_components() == 4
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_index_follows_directed_mutations(rep):
+    graph = Graph(3, rep, directed=True)
+    graph.add_edges([0, 1], [1, 2])
+    assert not graph.are_connected(0, 2)
+    graph.add_edge(2, 0)
+    assert graph.are_connected(0, 2)
+    graph.remove_edge(1, 2)
+    assert not graph.are_connected(0, 2)
+    assert graph.are_connected(0, 1) is False
+
+
+def test_index_close_stops_updates():
+    graph = Graph(3, "AdjacentSet")
+    index = ConnectivityIndex(graph.prop)
+    assert index.num_components() == 3
+    index.close()
+    graph.add_edge(0, 1)
+    assert index.num_components() == 3
@@ -0,0 +1,146 @@
+import random
+import pytest
+from algorithms.graph_algorithms import Graph
+from representations.adjacent_set import AdjacentSet
+from representations.csr import CSR
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR", "NumpyMatrix", "SparseMatrix"]
+
+
+def edges_of(prop):
+    return {(v1, v2, int(prop.get_edge_weight(v1, v2)))
+            for v1 in range(prop.num_vertices) for v2 in prop.get_adjacent_vertices(v1)}
+
+
+def make_graph(rep, num_vertices, directed=False):
+    if rep in ("NumpyMatrix", "SparseMatrix"):
+        pytest.importorskip("numpy")
+    if rep == "SparseMatrix":
+        pytest.importorskip("scipy")
+    return Graph(num_vertices, rep, directed=directed)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(10))
+def test_csr_merge_matches_adjacent_set(seed, directed):
+    rng = random.Random(seed)
+    n = 6
+    csr, reference = CSR(n, directed), AdjacentSet(n, directed)
+    for _ in range(150):
+        op = rng.random()
+        if op < 0.05:
+            csr.add_vertex()
+            reference.add_vertex()
+            n += 1
+        elif op < 0.1:
+            count = rng.randint(1, 3)
+            assert csr.add_vertices(count) == reference.add_vertices(count)
+            n += count
+        elif op < 0.25:
+            k = rng.randint(0, 5)
+            src = [rng.randrange(n) for _ in range(k)]
+            dst = [rng.randrange(n) for _ in range(k)]
+            weights = [rng.randint(1, 9) for _ in range(k)]
+            csr.add_edges(src, dst, weights)
+            reference.add_edges(src, dst, weights)
+        else:
+            v1, v2 = rng.randrange(n), rng.randrange(n)
+            # has_edge answers from the staged changes, without merging them first
+            assert csr.has_edge(v1, v2) == reference.has_edge(v1, v2)
+            r = rng.random()
+            if r < 0.4:
+                weight = rng.randint(1, 9)
+                csr.add_edge(v1, v2, weight)
+                reference.add_edge(v1, v2, weight)
+            elif r < 0.7 and reference.has_edge(v1, v2):
+                csr.remove_edge(v1, v2)
+                reference.remove_edge(v1, v2)
+            elif r < 0.8 and reference.has_edge(v1, v2):
+                csr.update_weight(v1, v2, 7)
+                reference.update_weight(v1, v2, 7)
+            elif r < 0.9:
+                csr.get_outdegree(0)
+    assert edges_of(csr) == edges_of(reference)
+    for v in range(n):
+        assert list(csr.get_adjacent_vertices(v)) == sorted(reference.get_adjacent_vertices(v))
+        assert sorted(csr.get_incoming_vertices(v)) == sorted(reference.get_incoming_vertices(v))
+        assert csr.get_indegree(v) == reference.get_indegree(v)
+        assert csr.get_outdegree(v) == reference.get_outdegree(v)
+
+
+def test_csr_remove_missing_edge_raises():
+    csr = CSR(3)
+    csr.add_edge(0, 1)
+    csr.remove_edge(0, 1)
+    with pytest.raises(ValueError):
+        csr.remove_edge(1, 0)
+    with pytest.raises(ValueError):
+        csr.update_weight(0, 1, 4)
+
+
+@pytest.mark.parametrize("rep", REPS)
+@pytest.mark.parametrize("directed", [False, True])
+def test_remove_vertex_renumbers(rep, directed):
+    graph = make_graph(rep, 5, directed)
+    graph.add_edges([0, 1, 2, 3, 4], [1, 2, 3, 4, 0], [1, 2, 3, 4, 5])
+    graph.remove_vertex(2)
+    prop = graph.prop
+    assert prop.num_vertices == 4
+    expected = {(0, 1, 1), (2, 3, 4), (3, 0, 5)}
+    if not directed:
+        expected |= {(v2, v1, weight) for v1, v2, weight in expected}
+    assert edges_of(prop) == expected
+    assert [prop.get_indegree(v) for v in range(4)] == [len([e for e in expected if e[1] == v]) for v in range(4)]
+    assert sorted(prop.get_incoming_vertices(0)) == sorted(v1 for v1, v2, _ in expected if v2 == 0)
+    with pytest.raises(ValueError):
+        prop.get_adjacent_vertices(4)
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_snapshot_is_isolated_from_writes(rep):
+    graph = make_graph(rep, 4, directed=True)
+    graph.add_edges([0, 1], [1, 2], [3, 4])
+    snapshot = graph.snapshot()
+    before = edges_of(snapshot.prop)
+    graph.add_edge(2, 3, 5)
+    graph.update_weight(0, 1, 9)
+    graph.remove_edge(1, 2)
+    graph.add_vertices(2)
+    assert edges_of(snapshot.prop) == before == {(0, 1, 3), (1, 2, 4)}
+    assert snapshot.prop.num_vertices == 4
+    assert snapshot.shortest_path_weighted(0, 2) == [0, 1, 2]
+    assert edges_of(graph.prop) == {(0, 1, 9), (2, 3, 5)}
+    with pytest.raises(ValueError):
+        snapshot.prop.add_edge(0, 3)
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_mutations_bump_version_and_notify(rep):
+    graph = make_graph(rep, 3)
+    events = []
+    graph.prop.subscribe(lambda event, *args: events.append(event))
+    version = graph.prop.version
+    graph.add_edge(0, 1)
+    graph.update_weight(0, 1, 2)
+    graph.remove_edge(0, 1)
+    graph.add_vertex()
+    graph.add_vertices(2)
+    graph.remove_vertex(0)
+    assert graph.prop.version == version+6
+    assert events == ["add_edge", "add_edge", "remove_edge", "add_vertex", "add_vertices", "remove_vertex"]
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_growing_one_vertex_at_a_time(rep):
+    graph = make_graph(rep, 1, directed=True)
+    snapshots = []
+    for v in range(1, 40):
+        assert graph.add_vertex() == v
+        graph.add_edge(v-1, v, v)
+        if v % 10 == 0:
+            snapshots.append((v, graph.snapshot()))
+    assert edges_of(graph.prop) == {(v-1, v, v) for v in range(1, 40)}
+    assert [graph.prop.get_indegree(v) for v in range(40)] == [0]+[1]*39
+    for size, snapshot in snapshots:
+        assert snapshot.prop.num_vertices == size+1
+        assert edges_of(snapshot.prop) == {(v-1, v, v) for v in range(1, size+1)}
@@ -0,0 +1,106 @@
+import random
+import sys
+import threading
+import uuid
+import pytest
+from algorithms.graph_algorithms import Graph
+from algorithms.labeled_graph import LabeledGraph
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"]
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_labels_in_and_out(rep):
+    graph = LabeledGraph(rep)
+    graph.add_edge("a", "b", 2)
+    graph.add_edges(["a", "b", "x"], ["c", "d", "y"], [4, 1, 1])
+    graph.add_vertex("e")
+    graph.add_vertex("a")
+    assert graph.graph.prop.num_vertices == 7
+    assert graph.breadth_first_search("a") == ["a", "b", "c", "d"]
+    assert graph.shortest_path_weighted("a", "d") == ["a", "b", "d"]
+    assert graph.minimum_cost("a", "d") == 3
+    assert graph.are_connected("x", "y") and not graph.are_connected("a", "x")
+    assert sorted(graph.minimum_spanning_tree_prim("a")) == [("a", "b", 2), ("a", "c", 4), ("b", "d", 1)]
+    graph.remove_vertex("b")
+    assert graph.labels.labels() == ["a", "x", "c", "d", "y", "e"]
+    assert graph.get_adjacent_vertices("a") == ["c"]
+    graph.update_weight("a", "c", 7)
+    assert graph.get_edge_weight("a", "c") == 7
+    graph.remove_edge("a", "c")
+    assert graph.get_outdegree("a") == 0
+    with pytest.raises(ValueError):
+        graph.get_edge_weight("a", "zzz")
+
+
+def test_matches_integer_graph():
+    rng = random.Random(0)
+    labels = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(100)]
+    src, dst = [rng.choice(labels) for _ in range(500)], [rng.choice(labels) for _ in range(500)]
+    weights = [rng.randint(1, 9) for _ in src]
+    labeled = LabeledGraph.from_edges(src, dst, weights, rep="CSR", directed=True)
+    ids = labeled.labels
+    graph = Graph.from_edges(len(ids), ids.ids_of(src), ids.ids_of(dst), weights, rep="CSR", directed=True)
+    for _ in range(20):
+        source, destination = rng.choice(src), rng.choice(src)
+        expected = graph.shortest_path_weighted(ids.id_of(source), ids.id_of(destination))
+        assert labeled.shortest_path_weighted(source, destination) == ids.labels_of(expected)
+
+
+def test_bulk_growth_adds_vertices_once():
+    graph = LabeledGraph("NumpyMatrix" if _has_numpy() else "AdjacentMatrix")
+    events = []
+    graph.graph.prop.subscribe(lambda event, *args: events.append(event))
+    graph.add_edges([f"a{i}" for i in range(50)], [f"b{i}" for i in range(50)])
+    assert graph.graph.prop.num_vertices == 100
+    assert events == ["add_vertices", "add_edges"]
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    # makes a label translation racing with remove_vertex likely
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_queries_never_see_renumbered_ids(frequent_thread_switches):
+    # "hub" reaches every leaf, removing leaves renumbers the ids of the leaves added after them
+    graph = LabeledGraph("AdjacentSet", directed=True)
+    leaves = [f"leaf{i}" for i in range(1000)]
+    graph.add_edges(["hub"]*len(leaves), leaves)
+    done = threading.Event()
+    errors = []
+
+    def writer():
+        try:
+            for leaf in leaves[::2]:
+                graph.remove_vertex(leaf)
+        finally:
+            done.set()
+
+    def reader():
+        try:
+            while not done.is_set():
+                for leaf in leaves[1::2][::10]:
+                    assert graph.shortest_path_unweighted("hub", leaf) == ["hub", leaf]
+                    assert graph.get_incoming_vertices(leaf) == ["hub"]
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=writer)]+[threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+    assert not errors
+    assert sorted(graph.get_adjacent_vertices("hub")) == sorted(leaves[1::2])
+
+
+def _has_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,27 @@
+import time
+from algorithms.graph_algorithms import Graph
+
+
+def test_batch_matches_single_searches():
+    graph = Graph.from_edges(6, [0, 1, 2, 3, 0], [1, 2, 3, 4, 4], [1, 1, 1, 1, 9], "CSR")
+    results = dict(graph.batch_shortest_paths(range(6), workers=2))
+    assert results == {source: graph.shortest_path_tree(source).distances() for source in range(6)}
+    assert graph.all_pairs_distances(workers=2, weighted=False)[0] == [0, 1, 2, 2, 1, None]
+
+
+def test_batch_ignores_later_writes():
+    graph = Graph.from_edges(3, [0], [1], None, "AdjacentSet")
+    results = graph.batch_shortest_paths([0], workers=1)
+    graph.add_edge(1, 2)
+    assert list(results) == [(0, [0, 1, None])]
+
+
+def test_closing_batch_stops_work():
+    n = 3000
+    graph = Graph.from_edges(n, range(n-1), range(1, n), None, "AdjacentSet")
+    results = graph.batch_shortest_paths(range(n), workers=2)
+    start = time.perf_counter()
+    assert next(results)[0] == 0
+    results.close()
+    # the whole batch takes tens of seconds, closing waits only for the chunks already sent to the workers
+    assert time.perf_counter()-start < 10
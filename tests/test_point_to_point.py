@@ -0,0 +1,86 @@
+import random
+import pytest
+from algorithms.graph_algorithms import Graph
+from algorithms.point_to_point import astar, bidirectional_bfs, bidirectional_dijkstra, euclidean_heuristic
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"]
+
+
+def random_graph(rep, seed, directed, n=30, m=70):
+    rng = random.Random(seed)
+    src = [rng.randrange(n) for _ in range(m)]
+    dst = [rng.randrange(n) for _ in range(m)]
+    weights = [rng.randint(1, 9) for _ in range(m)]
+    return Graph.from_edges(n, src, dst, weights, rep, directed)
+
+
+def path_cost(prop, path):
+    for v1, v2 in zip(path, path[1:]):
+        assert prop.has_edge(v1, v2)
+    return sum(prop.get_edge_weight(v1, v2) for v1, v2 in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("rep", REPS)
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_strategies_match_full_searches(rep, directed, seed):
+    graph = random_graph(rep, seed, directed)
+    prop, n = graph.prop, graph.prop.num_vertices
+    zero = lambda v, destination: 0
+    for source in range(0, n, 3):
+        costs = graph.shortest_path_tree(source).distances()
+        hops = graph.shortest_path_tree(source, weighted=False).distances()
+        for destination in range(n):
+            path, cost = bidirectional_bfs(prop, source, destination)
+            assert cost == hops[destination]
+            assert (path == []) == (cost is None)
+            if path:
+                assert path[0] == source and path[-1] == destination and len(path)-1 == cost
+            for search in (lambda: bidirectional_dijkstra(prop, source, destination),
+                           lambda: astar(prop, source, destination, zero)):
+                path, cost = search()
+                assert cost == costs[destination]
+                if cost is not None:
+                    assert path[0] == source and path[-1] == destination
+                    assert path_cost(prop, path) == cost
+            if costs[destination] is not None:
+                assert graph.minimum_cost(source, destination, strategy="bidirectional") == \
+                    graph.minimum_cost(source, destination)
+
+
+def test_astar_with_euclidean_heuristic_on_grid():
+    side = 8
+    coordinates = [(v % side, v//side) for v in range(side*side)]
+    rng = random.Random(0)
+    src, dst, weights = [], [], []
+    for v in range(side*side):
+        for neighbor in (v+1 if v % side != side-1 else None, v+side if v+side < side*side else None):
+            if neighbor is not None:
+                src.append(v), dst.append(neighbor), weights.append(rng.randint(1, 4))
+    graph = Graph.from_edges(side*side, src, dst, weights, "AdjacentSet")
+    heuristic = euclidean_heuristic(coordinates)
+    for destination in (7, 36, 63):
+        assert graph.minimum_cost(0, destination, strategy="astar", heuristic=heuristic) == \
+            graph.minimum_cost(0, destination)
+        path = graph.shortest_path_weighted(0, destination, strategy="astar", heuristic=heuristic)
+        assert path_cost(graph.prop, path) == graph.minimum_cost(0, destination)
+
+
+def test_backward_search_without_reverse_index():
+    graph = Graph(5, "AdjacentSet", directed=True, reverse_index=False)
+    graph.add_edges([0, 1, 2, 0], [1, 2, 3, 3], [1, 1, 1, 5])
+    assert graph.shortest_path_unweighted(0, 3, strategy="bidirectional") == [0, 3]
+    assert graph.shortest_path_weighted(0, 3, strategy="bidirectional") == [0, 1, 2, 3]
+    assert bidirectional_dijkstra(graph.prop, 0, 4) == ([], None)
+
+
+def test_rejects_bad_strategies():
+    graph = random_graph("CSR", 0, False)
+    with pytest.raises(ValueError):
+        graph.shortest_path_weighted(0, 1, strategy="astar")
+    with pytest.raises(ValueError):
+        graph.shortest_path_weighted(0, 1, strategy="bellman-ford")
+    with pytest.raises(ValueError):
+        graph.shortest_path_unweighted(0, 1, strategy="dijkstra")
+    with pytest.raises(ValueError):
+        bidirectional_bfs(graph.prop, 0, 30)
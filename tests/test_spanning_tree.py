@@ -0,0 +1,77 @@
+import random
+from itertools import combinations
+import pytest
+from algorithms.graph_algorithms import Graph
+from help_ds.disjoint_set import DisjointSet
+
+REPS = ["AdjacentMatrix", "AdjacentSet", "CompactSet", "CSR"]
+
+
+def random_graph(rep, seed, n=7, m=11):
+    rng = random.Random(seed)
+    edges = {}
+    for _ in range(m):
+        v1, v2 = rng.sample(range(n), 2)
+        edges[min(v1, v2), max(v1, v2)] = rng.randint(1, 9)
+    src, dst = [v1 for v1, _ in edges], [v2 for _, v2 in edges]
+    return Graph.from_edges(n, src, dst, list(edges.values()), rep), edges
+
+
+def brute_force_forest_weight(n, edges):
+    components = DisjointSet(n)
+    for v1, v2 in edges:
+        components.union(v1, v2)
+    size = n-components.num_sets
+    best = None
+    for subset in combinations(edges, size):
+        forest = DisjointSet(n)
+        if all(forest.union(v1, v2) for v1, v2 in subset):
+            weight = sum(edges[edge] for edge in subset)
+            best = weight if best is None else min(best, weight)
+    return best
+
+
+def is_spanning_forest(n, edges, tree, vertices):
+    forest = DisjointSet(n)
+    for v1, v2, weight in tree:
+        assert edges[min(v1, v2), max(v1, v2)] == weight
+        assert forest.union(v1, v2)
+    return all(forest.find(v1) == forest.find(v2) for v1, v2 in edges if v1 in vertices)
+
+
+@pytest.mark.parametrize("rep", REPS)
+@pytest.mark.parametrize("seed", range(8))
+def test_forest_weight_matches_brute_force(rep, seed):
+    graph, edges = random_graph(rep, seed)
+    n = graph.prop.num_vertices
+    forest = graph.minimum_spanning_tree_kruskal()
+    assert is_spanning_forest(n, edges, forest, set(range(n)))
+    assert sum(weight for _, _, weight in forest) == brute_force_forest_weight(n, edges)
+
+    component = set(graph.breadth_first_search(0))
+    component_edges = {edge: weight for edge, weight in edges.items() if edge[0] in component}
+    expected = brute_force_forest_weight(n, component_edges)
+    for tree in (graph.minimum_spanning_tree_prim(0), graph.minimum_spanning_tree_kruskal(0)):
+        assert len(tree) == len(component)-1
+        assert {v for edge in tree for v in edge[:2]} <= component
+        assert is_spanning_forest(n, component_edges, tree, component)
+        assert sum(weight for _, _, weight in tree) == expected
+
+
+def test_forest_of_disconnected_graph():
+    graph = Graph.from_edges(7, [0, 1, 0, 3, 4], [1, 2, 2, 4, 5], [1, 2, 5, 3, 1], "AdjacentSet")
+    assert sorted(graph.minimum_spanning_tree_kruskal()) == [(0, 1, 1), (1, 2, 2), (3, 4, 3), (4, 5, 1)]
+    assert sorted(graph.minimum_spanning_tree_kruskal(4)) == [(3, 4, 3), (4, 5, 1)]
+    assert graph.minimum_spanning_tree_prim(6) == []
+    assert graph.minimum_spanning_tree_kruskal(6) == []
+
+
+@pytest.mark.parametrize("rep", REPS)
+def test_rejects_directed_graphs(rep):
+    graph = Graph.from_edges(3, [0, 1], [1, 2], None, rep, directed=True)
+    with pytest.raises(ValueError):
+        graph.minimum_spanning_tree_prim(0)
+    with pytest.raises(ValueError):
+        graph.minimum_spanning_tree_kruskal()
+    with pytest.raises(ValueError):
+        Graph(3, rep).minimum_spanning_tree_prim(3)
@@ -0,0 +1,92 @@
+import pytest
+from algorithms.graph_algorithms import Graph
+from storage.edge_list import read_edge_list
+from storage.streaming import (AdjacencyListWriter, EdgeListWriter, build_csr_file, ingest, iter_adjacency_list,
+                               iter_binary_edge_list, iter_edge_list, write_adjacency_list)
+
+
+def edges_of(prop):
+    return {(v1, v2, prop.get_edge_weight(v1, v2))
+            for v1 in range(prop.num_vertices) for v2 in prop.get_adjacent_vertices(v1)}
+
+
+def concat(chunks):
+    src, dst, weights = [], [], []
+    for chunk_src, chunk_dst, chunk_weights in chunks:
+        assert len(chunk_src) == len(chunk_dst)
+        assert chunk_weights is None or len(chunk_weights) == len(chunk_src)
+        src.extend(chunk_src)
+        dst.extend(chunk_dst)
+        weights.extend(chunk_weights if chunk_weights is not None else [1]*len(chunk_src))
+    return src, dst, weights
+
+
+def test_edge_list_chunks_match_whole_file(tmp_path):
+    path = tmp_path/"edges.txt"
+    path.write_text("# comment\n0,1,2\n1,2,3.5\n\n2,3,1\n")
+    src, dst, weights = read_edge_list(path, ",")
+    for chunk_size in (1, 2, 100):
+        assert concat(iter_edge_list(path, chunk_size, ",")) == (list(src), list(dst), list(weights))
+    assert list(weights) == [2.0, 3.5, 1.0]
+
+
+@pytest.mark.parametrize("reader", [read_edge_list, lambda path: list(iter_edge_list(path, 2))])
+def test_edge_list_rejects_mixed_columns(tmp_path, reader):
+    path = tmp_path/"edges.txt"
+    path.write_text("0 1 5\n1 2\n2 3\n4 5\n")
+    with pytest.raises(ValueError):
+        reader(path)
+
+
+def test_binary_edge_list_round_trip(tmp_path):
+    path = tmp_path/"edges.bin"
+    with EdgeListWriter(path, binary=True, float_weights=True) as writer:
+        writer.write_edges([0, 1, 2], [1, 2, 0], [1.5, 2, 3])
+        writer.write_edge(3, 0, 4)
+    assert concat(iter_binary_edge_list(path, 2)) == ([0, 1, 2, 3], [1, 2, 0, 0], [1.5, 2.0, 3.0, 4.0])
+
+
+def test_adjacency_list_round_trip(tmp_path):
+    path = tmp_path/"set.txt"
+    graph = Graph.from_edges(4, [0, 0, 1, 2], [1, 2, 3, 3], [2, 1, 5, 4], "AdjacentMatrix")
+    write_adjacency_list(graph.prop, path, header="vertex & (adjacent vertices,weight)")
+    copy = Graph(4, "AdjacentSet")
+    ingest(copy.prop, iter_adjacency_list(path, chunk_size=2, skip_lines=1))
+    assert edges_of(copy.prop) == edges_of(graph.prop)
+
+
+def test_adjacency_list_mixed_int_and_float_weights(tmp_path):
+    path = tmp_path/"set.txt"
+    with AdjacencyListWriter(path) as writer:
+        writer.write_vertex(0, [1, 2], [3, 5.5])
+        writer.write_vertex(1, [0], [3])
+        writer.write_vertex(3, [], [])
+    assert concat(iter_adjacency_list(path)) == ([0, 0, 1], [1, 2, 0], [3.0, 5.5, 3.0])
+    graph = Graph(4, "CSR", directed=True)
+    assert ingest(graph.prop, iter_adjacency_list(path)) == 3
+    assert edges_of(graph.prop) == {(0, 1, 3.0), (0, 2, 5.5), (1, 0, 3.0)}
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_build_csr_file_matches_in_memory_graph(tmp_path, directed):
+    path = tmp_path/"graph.bin"
+    src, dst, weights = [0, 5, 2, 0, 9, 3, 0], [1, 2, 9, 1, 9, 0, 7], [4, 1, 2, 6, 3, 5, 1]
+    chunks = [(src[i:i+2], dst[i:i+2], weights[i:i+2]) for i in range(0, len(src), 2)]
+    num_vertices, num_edges = build_csr_file(chunks, path, directed=directed, vertices_per_partition=3,
+                                             max_buffered_edges=2)
+    expected = Graph.from_edges(10, src, dst, weights, "AdjacentSet", directed)
+    loaded = Graph.load(path)
+    assert num_vertices == 10
+    assert edges_of(loaded.prop) == edges_of(expected.prop)
+    assert num_edges == len(edges_of(expected.prop))
+    assert [loaded.prop.get_indegree(v) for v in range(10)] == [expected.prop.get_indegree(v) for v in range(10)]
+
+
+def test_build_csr_file_rejects_out_of_range_vertices(tmp_path):
+    path = tmp_path/"graph.bin"
+    with pytest.raises(ValueError):
+        build_csr_file([([0, -1], [1, 2], [1, 1])], path)
+    with pytest.raises(ValueError):
+        build_csr_file([([0, 1], [1, -2], None)], path, num_vertices=3)
+    with pytest.raises(ValueError):
+        build_csr_file([([0, 1], [1, 3], None)], path, num_vertices=3)